@@ -11,14 +11,15 @@
 # add these directories to sys.path here. If the directory is relative to the
 # documentation root, use pathlib's resolve() to make it absolute, like shown here.
 #
+import functools
 import importlib
+import os
 import sys
 import types
 
+from importlib.metadata import version as get_version
 from pathlib import Path
 
-from pkg_resources import get_distribution
-
 import sphinx_rtd_theme
 
 from sphinx import __version__ as sphinx_version
@@ -41,10 +42,12 @@ extensions = [
     'sphinx.ext.intersphinx',
     'sphinx.ext.todo',
     'sphinx.ext.coverage',
-    'sphinx.ext.viewcode',
     'sphinx.ext.githubpages',
     'sphinxarg.ext',
 ]
+# The generation of the highlighted source code pages is slow, allow to skip it for quicker check-only builds.
+if not os.environ.get('SPHINX_SKIP_VIEWCODE'):
+    extensions.append('sphinx.ext.viewcode')
 
 # Add any paths that contain templates here, relative to this directory.
 templates_path = ['_templates']
@@ -70,7 +73,7 @@ author = u'Riccardo Coccioli'
 # built documents.
 #
 # The full version, including alpha/beta/rc tags.
-release = get_distribution('wmflib').version
+release = get_version('wmflib')
 # The short X.Y version.
 version = release
 
@@ -166,6 +169,12 @@ def add_abstract_annotations(app, what, name, obj, options, lines):
         lines.insert(0, '``abstract``')
 
 
+@functools.lru_cache(maxsize=None)
+def get_class(module_name, class_name):
+    """Dynamically import the module and return the given class, caching the result for the subsequent calls."""
+    return getattr(importlib.import_module(module_name), class_name)
+
+
 def add_inherited_annotations(app, what, name, obj, options, lines):
     """Workaround to add an inherited annotation for methods inherited from the parent classes."""
     if what == 'method':
@@ -174,15 +183,13 @@ def add_inherited_annotations(app, what, name, obj, options, lines):
                 lines.insert(0, '``inherited``')
         elif isinstance(obj, types.FunctionType):  # Static methods
             module_name, class_name, _ = name.rsplit('.', 2)
-            module = importlib.import_module(module_name)  # Dynamically import the module
-            if obj.__name__ not in getattr(module, class_name).__dict__:  # Dynamically inspect the class
+            if obj.__name__ not in get_class(module_name, class_name).__dict__:  # Dynamically inspect the class
                 lines.insert(0, '``inherited``')
                 lines.insert(0, '``static``')
 
     elif what == 'attribute':
         module_name, class_name, prop = name.rsplit('.', 2)
-        module = importlib.import_module(module_name)  # Dynamically import the module
-        if prop not in getattr(module, class_name).__dict__:  # Dynamically inspect the class
+        if prop not in get_class(module_name, class_name).__dict__:  # Dynamically inspect the class
             lines.insert(0, '``inherited``')
 
 
@@ -1,9 +1,58 @@
 """wmflib package."""
+import sys
 
-from pkg_resources import DistributionNotFound, get_distribution
+from importlib import import_module
+from types import ModuleType
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - only for static type checkers
+    from wmflib import (  # noqa: F401 pylint: disable=unused-import,cyclic-import
+        actions, config, constants, decorators, dns, exceptions, fileio, idm, interactive, irc, phabricator,
+        prometheus, requests)
+
+if sys.version_info >= (3, 8):
+    from importlib.metadata import PackageNotFoundError, version
+else:  # pragma: no cover - only for Python 3.7
+    from importlib_metadata import PackageNotFoundError, version
+
+SUBMODULES = ('actions', 'config', 'constants', 'decorators', 'dns', 'exceptions', 'fileio', 'idm', 'interactive',
+              'irc', 'phabricator', 'prometheus', 'requests')
+""":py:class:`tuple`: the wmflib submodules that are lazily imported on first access as attributes of the package."""
 
 try:
-    __version__: str = get_distribution('wmflib').version  # Must be the same used as 'name' in setup.py
+    __version__: str = version(__name__)  # Must be the same used as 'name' in the [project] table of pyproject.toml
     """:py:class:`str`: the version of the current wmflib package."""
-except DistributionNotFound:  # pragma: no cover - this should never happen during tests
+except PackageNotFoundError:  # pragma: no cover - this should never happen during tests
     pass  # package is not installed
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Lazily import the wmflib submodules on first access, see :pep:`562`.
+
+    This allows to access any submodule as ``wmflib.<name>`` after just an ``import wmflib``, paying the import cost
+    of the submodule and its dependencies only when actually used.
+
+    Arguments:
+        name (str): the name of the attribute to get.
+
+    Returns:
+        types.ModuleType: the imported submodule.
+
+    Raises:
+        AttributeError: if the name is not one of the wmflib submodules.
+
+    """
+    if name in SUBMODULES:
+        return import_module(f'{__name__}.{name}')  # The import system also sets it as an attribute of the package
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__() -> List[str]:
+    """Include the lazily imported submodules in the package attributes, see :pep:`562`.
+
+    Returns:
+        list: the sorted list of the package attributes.
+
+    """
+    return sorted(set(globals()).union(SUBMODULES))
@@ -1,15 +1,22 @@
 """Actions module."""
 import logging
 
-from typing import Hashable, List
+from types import TracebackType
+from typing import Hashable, List, Optional, Tuple, Type
 
 
 logger = logging.getLogger(__name__)
+_STATUSES = ('PASS', 'WARN', 'FAIL')  # Ordered by severity, indexed by the bit length of the Actions status flags
+_WARNING_FLAG = 1
+_FAILURE_FLAG = 2
 
 
 class Actions:
     """Class to keep track and log a set of actions performed and their result with a nice string representation."""
 
+    # Save memory with many instances, like in an ActionsDict with a large number of hosts
+    __slots__ = ('name', 'actions', '_formatted_actions', '_status_flags', '_pending_logs')
+
     def __init__(self, name: Hashable):
         """The instance gets initialized with the given name, that can represent a host or any other identifier.
 
@@ -48,14 +55,55 @@ class Actions:
                   - Downtimed on Icinga
                   - Restarted ntp
 
+            It can also be used as a context manager to log all the actions registered within the context in a single
+            log record when exiting it, with the level of the most severe one, instead of one log record per action::
+
+                with Actions('host1001') as actions:
+                    actions.success('Downtimed on Icinga')
+                    actions.success('Restarted ntp')
+
+            The above code will log, with info level::
+
+                Actions on host1001:
+                  - Downtimed on Icinga
+                  - Restarted ntp
+
         Arguments:
             name (typing.Hashable): the name of the set of actions to be registered.
 
         """
         self.name = name
         self.actions: List[str] = []
-        self.has_warnings = False
-        self.has_failures = False
+        self._formatted_actions: List[str] = []  # Pre-formatted actions for the string representation
+        self._status_flags = 0  # Bitwise OR of the flags of the non-successful results recorded
+        self._pending_logs: Optional[List[Tuple[int, str]]] = None  # The actions to log, only when used as context
+
+    def __enter__(self) -> 'Actions':
+        """Start buffering the log records of the registered actions until the context is exited.
+
+        Returns:
+            wmflib.actions.Actions: the instance itself.
+
+        """
+        self._pending_logs = []
+        return self
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]], exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        """Log all the actions registered within the context in a single log record.
+
+        Parameters as required by Python's data model, see :py:meth:`object.__exit__`.
+
+        """
+        pending_logs = self._pending_logs
+        self._pending_logs = None
+        if not pending_logs:
+            return
+
+        level = max(log_level for log_level, _ in pending_logs)
+        if logger.isEnabledFor(level):
+            messages = '\n'.join(f'  - {message}' for _, message in pending_logs)
+            logger.log(level, 'Actions on %s:\n%s', self.name, messages)
 
     def __str__(self) -> str:
         """Custom string representation of the actions performed.
@@ -64,7 +112,7 @@ class Actions:
             str: the string representation.
 
         """
-        actions = '\n'.join(f'  - {action}' for action in self.actions)
+        actions = '\n'.join(self._formatted_actions)
         return f'{self.name} (**{self.status}**)\n{actions}'
 
     @property
@@ -78,12 +126,27 @@ class Actions:
                 * ``PASS`` if only success actions were registered
 
         """
-        if self.has_failures:
-            return 'FAIL'
-        if self.has_warnings:
-            return 'WARN'
+        return _STATUSES[self._status_flags.bit_length()]  # The most severe flag set determines the status
+
+    @property
+    def has_warnings(self) -> bool:
+        """Return whether at least one warning action was registered.
+
+        Returns:
+            bool: :py:data:`True` when at least one warning action was registered, :py:data:`False` otherwise.
+
+        """
+        return bool(self._status_flags & _WARNING_FLAG)
+
+    @property
+    def has_failures(self) -> bool:
+        """Return whether at least one failed action was registered.
 
-        return 'PASS'
+        Returns:
+            bool: :py:data:`True` when at least one failed action was registered, :py:data:`False` otherwise.
+
+        """
+        return bool(self._status_flags & _FAILURE_FLAG)
 
     def success(self, message: str) -> None:
         """Register a successful action, it gets also logged with info level.
@@ -102,7 +165,7 @@ class Actions:
 
         """
         self._action(logging.ERROR, message)
-        self.has_failures = True
+        self._status_flags |= _FAILURE_FLAG
 
     def warning(self, message: str) -> None:
         """Register an action that require some attention, it gets also logged with warning level.
@@ -112,7 +175,7 @@ class Actions:
 
         """
         self._action(logging.WARNING, message)
-        self.has_warnings = True
+        self._status_flags |= _WARNING_FLAG
 
     def _action(self, level: int, message: str) -> None:
         """Register a generic action.
@@ -122,8 +185,13 @@ class Actions:
             message (str): the action description.
 
         """
-        logger.log(level, message)
+        if self._pending_logs is not None:  # Within a context, log them all at once when exiting it
+            self._pending_logs.append((level, message))
+        elif logger.isEnabledFor(level):  # Skip the logging call overhead for the disabled levels
+            logger.log(level, message)
+
         self.actions.append(message)
+        self._formatted_actions.append(f'  - {message}')
 
 
 class ActionsDict(dict):
@@ -176,4 +244,4 @@ class ActionsDict(dict):
             str: the string representation of each item in the dictionary, newline-separated.
 
         """
-        return '\n'.join(f'- {value}\n' for value in self.values())
+        return '\n'.join([f'- {value}\n' for value in self.values()])  # A list is faster than a generator for join
@@ -2,9 +2,11 @@
 
 import configparser
 import logging
+import os
 
+from copy import deepcopy
 from os import PathLike
-from typing import Dict, Union
+from typing import Any, Dict, Tuple, Union
 
 import yaml
 
@@ -12,11 +14,46 @@ from wmflib.exceptions import WmflibError
 
 
 logger = logging.getLogger(__name__)
+# Use the LibYAML-based loader when PyYAML was built with it, it's much faster than the pure Python one
+_YAML_SAFE_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+# Cache of the parsed YAML config files, keyed by absolute path, with the (mtime, size) signature of the parsed file.
+# INI files are not cached as copying a ConfigParser instance is slower than parsing a typical INI file again.
+_YAML_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def clear_config_cache() -> None:
+    """Clear the cache of the already parsed configuration files.
+
+    The configuration files loaded by :py:func:`wmflib.config.load_yaml_config` are cached and parsed again only if
+    their modification time or size changes. This function allows to force a new parsing of all of them.
+
+    """
+    _YAML_CACHE.clear()
+
+
+def _file_signature(config_file: Union[str, PathLike]) -> Tuple[str, Tuple[int, int]]:
+    """Return the absolute path and the signature of the given file to detect its modifications.
+
+    Arguments:
+        config_file (str): the path of the configuration file.
+
+    Returns:
+        tuple: the absolute path of the file and a tuple with its modification time in nanoseconds and its size.
+
+    Raises:
+        OSError: if unable to access the file.
+
+    """
+    stat = os.stat(config_file)
+    return os.path.abspath(config_file), (stat.st_mtime_ns, stat.st_size)
 
 
 def load_yaml_config(config_file: Union[str, PathLike], raises: bool = True) -> Dict:
     """Parse a YAML config file and return it, optionally not failing on error.
 
+    The parsed configuration is cached and the file is parsed again only if modified, see
+    :py:func:`wmflib.config.clear_config_cache`. A copy is returned each time, hence it can be safely modified.
+
     Arguments:
         config_file (str): the path of the configuration file.
         raises (bool, optional): whether to raise exception if unable to load the config.
@@ -30,8 +67,14 @@ def load_yaml_config(config_file: Union[str, PathLike], raises: bool = True) ->
     """
     config = {}
     try:
-        with open(config_file, 'r', encoding='utf-8') as fh:
-            config = yaml.safe_load(fh)
+        path, signature = _file_signature(config_file)
+        cached = _YAML_CACHE.get(path)
+        if cached is not None and cached[0] == signature:
+            config = deepcopy(cached[1])
+        else:
+            with open(config_file, 'rb') as fh:
+                config = yaml.load(fh, Loader=_YAML_SAFE_LOADER)  # nosec - the loader is always a safe one
+            _YAML_CACHE[path] = (signature, deepcopy(config))
 
     except Exception as e:  # pylint: disable=broad-except
         message = "Could not load config file %s: %s"
@@ -47,20 +90,25 @@ def load_yaml_config(config_file: Union[str, PathLike], raises: bool = True) ->
 
 
 def load_ini_config(config_file: Union[str, PathLike], raises: bool = True) -> configparser.ConfigParser:
-    """Parse an INI config file and return it.
+    """Parse an INI config file and return it, optionally not failing on error.
 
     Arguments:
         config_file (str): the path of the configuration file.
+        raises (bool, optional): whether to raise exception if unable to load the config.
 
     Returns:
-        configparser.ConfigParser: the parsed config.
+        configparser.ConfigParser: the parsed config or an empty one as a fallback when ``raises`` is ``False``.
+
+    Raises:
+        WmflibError: if unable to read or parse the configuration file and ``raises`` is ``True``.
 
     """
     config = configparser.ConfigParser()
     try:
-        config.read(config_file)
+        with open(config_file, 'r', encoding='utf-8') as fh:
+            config.read_file(fh)
 
-    except configparser.Error as e:
+    except (configparser.Error, OSError) as e:
         message = "Could not load config file %s: %s"
         if raises:
             raise WmflibError(repr(e)) from e
@@ -4,10 +4,16 @@
 ALL_DATACENTERS = ('eqiad', 'codfw', 'esams', 'ulsfo', 'eqsin', 'drmrs', 'magru')
 """tuple: all WMF datacenters."""
 
+ALL_DATACENTERS_SET = frozenset(ALL_DATACENTERS)
+"""frozenset: all WMF datacenters, to be used for membership tests."""
+
 
 CORE_DATACENTERS = ("eqiad", "codfw")
 """tuple: WMF core datacenters."""
 
+CORE_DATACENTERS_SET = frozenset(CORE_DATACENTERS)
+"""frozenset: WMF core datacenters, to be used for membership tests."""
+
 US_DATACENTERS = ("eqiad", "codfw", "ulsfo")
 """tuple: WMF datacenters in the US"""
 
@@ -1,20 +1,39 @@
 """Decorators module."""
+import asyncio
+import copy
+import inspect
 import logging
+import random
+import sys
 import time
 
 from dataclasses import dataclass
 from datetime import timedelta
 from functools import wraps
-from typing import Any, Callable, cast, Dict, Optional, Tuple, Type, Union
+from itertools import repeat
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Type, Union
 
 from wmflib.exceptions import WmflibError
 
 
 logger = logging.getLogger(__name__)
+_MAX_CHAINED_EXCEPTIONS = 32  # Maximum number of chained exceptions reported in the retry log messages
+# Functions to calculate the backoff sleep for each backoff mode given the base and the index of the attempt
+_BACKOFF_FUNCTIONS: Dict[str, Callable[[Union[int, float], int], Union[int, float]]] = {
+    'constant': lambda base, _index: base,
+    'linear': lambda base, index: base * index,
+    'power': lambda base, index: base * (1 << (index - 1)),
+    'exponential': lambda base, index: base ** index,
+}
+_BACKOFF_MODES = frozenset(_BACKOFF_FUNCTIONS)  # The valid backoff modes
+
+
+# The slots argument of dataclass is available only since Python 3.10
+_DATACLASS_KWARGS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 
 # TODO: use TypedDict once Python 3.7 support is removed
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class RetryParams:
     """Retry decorator parameters class.
 
@@ -30,6 +49,8 @@ class RetryParams:
     backoff_mode: str
     exceptions: Tuple[Type[Exception], ...]
     failure_message: str
+    max_delay: Optional[timedelta] = None
+    jitter: float = 0.0
 
     def validate(self) -> None:
         """Validate the consistency of the current values of the instance properties.
@@ -38,7 +59,7 @@ class RetryParams:
             wmflib.exceptions.WmflibError: if any field has an invalid value.
 
         """
-        if self.backoff_mode not in ('constant', 'linear', 'power', 'exponential'):
+        if self.backoff_mode not in _BACKOFF_MODES:
             raise WmflibError(f'Invalid backoff_mode: {self.backoff_mode}')
 
         if self.backoff_mode == 'exponential' and self.delay.total_seconds() < 1:
@@ -50,6 +71,12 @@ class RetryParams:
         if not self.failure_message:
             raise WmflibError('A failure_message must be set.')
 
+        if self.max_delay is not None and self.max_delay.total_seconds() <= 0:
+            raise WmflibError(f'Max delay must be positive, got {self.max_delay}')
+
+        if not 0 <= self.jitter <= 1:
+            raise WmflibError(f'Jitter must be between 0 and 1, got {self.jitter}')
+
 
 def ensure_wrap(func: Callable) -> Callable:
     """Decorator to wrap other decorators to allow to call them both with and without arguments.
@@ -79,6 +106,8 @@ def retry(  # pylint: disable=too-many-arguments,useless-suppression
     backoff_mode: str = 'exponential',
     exceptions: Tuple[Type[Exception], ...] = (WmflibError,),
     failure_message: Optional[str] = None,
+    max_delay: Optional[timedelta] = None,
+    jitter: float = 0.0,
     dynamic_params_callbacks: Tuple[Callable[[RetryParams, Callable, Tuple, Dict[str, Any]], None], ...] = (),
 ) -> Callable:
     """Decorator to retry a function or method if it raises certain exceptions with customizable backoff.
@@ -86,6 +115,8 @@ def retry(  # pylint: disable=too-many-arguments,useless-suppression
     Note:
         The decorated function or method must be idempotent to avoid unwanted side effects.
         It can be called with or without arguments, in the latter case all the default values will be used.
+        It can decorate also coroutine functions, in which case the delays between the attempts are awaited with
+        :py:func:`asyncio.sleep` instead of blocking the event loop.
 
     Examples:
         Define a function that polls for the existence of a file, retrying with the default parameters::
@@ -177,6 +208,12 @@ def retry(  # pylint: disable=too-many-arguments,useless-suppression
             or `tries` attempts are reached. A retryable failure is defined as raising any of the exceptions listed.
         failure_message (str, optional): the message to log each time there's a retryable failure. Retry information
             and exception message are also included. Default: "Attempt to run '<fully qualified function>' raised"
+        max_delay (datetime.timedelta, optional): the maximum delay between two attempts, to cap the delay computed
+            by the backoff algorithm. If not set the delay is not capped.
+        jitter (float, optional): the amount of random jitter to apply to each delay, as a fraction of the delay, to
+            avoid that multiple callers retry in lockstep. Must be between 0 and 1, with a jitter of ``0.2`` each delay
+            will be randomly picked between 80% and 120% of the computed delay. If ``max_delay`` is set, the jitter is
+            applied to the capped delay. By default no jitter is applied.
         dynamic_params_callbacks (tuple): a tuple of callbacks that will be called at runtime to allow to modify the
             decorator's parameters. Each callable must adhere to the following interface::
 
@@ -207,39 +244,167 @@ def retry(  # pylint: disable=too-many-arguments,useless-suppression
     if not failure_message:
         failure_message = f"Attempt to run '{func.__module__}.{func.__qualname__}' raised"
 
-    static_params: Dict[str, Any] = {
-        'tries': tries,
-        'delay': delay,
-        'backoff_mode': backoff_mode,
-        'exceptions': exceptions,
-        'failure_message': failure_message,
-    }
+    template = RetryParams(tries=tries, delay=delay, backoff_mode=backoff_mode, exceptions=exceptions,
+                           failure_message=failure_message, max_delay=max_delay, jitter=jitter)
 
-    @wraps(func)
-    def wrapper(*args: Any, **kwargs: Any) -> Any:
-        """Decorated function."""
-        params = RetryParams(**static_params)
+    if not dynamic_params_callbacks:  # The parameters can't change, validate them and pre-compute the delays only once
+        return _static_retry_wrapper(func, template)
+
+    def get_params(args: Tuple, kwargs: Dict[str, Any]) -> RetryParams:
+        """Get the validated parameters after applying the dynamic params callbacks."""
+        params = copy.copy(template)  # Cheaper than a new instance, the callbacks can modify only the copy
         for dynamic_params_callback in dynamic_params_callbacks:
             dynamic_params_callback(params, func, args, kwargs)
 
         params.validate()
-        attempt = 0
-        while attempt < params.tries - 1:
-            attempt += 1
+        return params
+
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            """Decorated coroutine function."""
+            params = get_params(args, kwargs)
+            for attempt, sleep in enumerate(_iter_delays(params), start=1):
+                try:
+                    # Call the decorated coroutine function or method
+                    return await func(*args, **kwargs)
+                except exceptions as e:
+                    await asyncio.sleep(_before_retry(params, attempt, sleep, e))
+
+            return await func(*args, **kwargs)
+
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        """Decorated function."""
+        params = get_params(args, kwargs)
+        for attempt, sleep in enumerate(_iter_delays(params), start=1):
             try:
                 # Call the decorated function or method
                 return func(*args, **kwargs)
             except exceptions as e:
-                sleep = get_backoff_sleep(params.backoff_mode, params.delay.total_seconds(), attempt)
-                logger.warning("[%d/%d, retrying in %.2fs] %s: %s",
-                               attempt, params.tries, sleep, params.failure_message, _exception_message(e))
-                time.sleep(sleep)
+                time.sleep(_before_retry(params, attempt, sleep, e))
+
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def _static_retry_wrapper(func: Callable, params: RetryParams) -> Callable:
+    """Return the wrapper for the @retry decorator when the parameters can't be modified at runtime.
+
+    Arguments:
+        func (function, method): the decorated function or coroutine function.
+        params (wmflib.decorators.RetryParams): the parameters, validated at the first call and not at decoration
+            time.
+
+    Returns:
+        function: the decorated function or coroutine function.
+
+    """
+    delays: Optional[Tuple[Union[int, float], ...]] = None
+
+    def get_delays() -> Tuple[Union[int, float], ...]:
+        """Validate the parameters and calculate the delays at the first call, returning the cached ones afterwards."""
+        nonlocal delays
+        if delays is None:
+            params.validate()
+            delays = tuple(_iter_delays(params))
+
+        return delays
+
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            """Decorated coroutine function."""
+            for attempt, sleep in enumerate(get_delays(), start=1):
+                try:
+                    # Call the decorated coroutine function or method
+                    return await func(*args, **kwargs)
+                except params.exceptions as e:
+                    await asyncio.sleep(_before_retry(params, attempt, sleep, e))
+
+            return await func(*args, **kwargs)
+
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        """Decorated function."""
+        for attempt, sleep in enumerate(get_delays(), start=1):
+            try:
+                # Call the decorated function or method
+                return func(*args, **kwargs)
+            except params.exceptions as e:
+                time.sleep(_before_retry(params, attempt, sleep, e))
 
         return func(*args, **kwargs)
 
     return wrapper
 
 
+def _before_retry(params: RetryParams, attempt: int, sleep: Union[int, float], exception: BaseException
+                  ) -> Union[int, float]:
+    """Apply the jitter, if any, to the sleep time before the next attempt and log the failure.
+
+    Arguments:
+        params (wmflib.decorators.RetryParams): the already validated parameters.
+        attempt (int): the number of the failed attempt.
+        sleep (int, float): the sleep time before the next attempt, without jitter.
+        exception (BaseException): the exception raised by the failed attempt.
+
+    Returns:
+        int, float: the sleep time to wait before the next attempt.
+
+    """
+    if params.jitter:
+        sleep = _apply_jitter(sleep, params.jitter)
+
+    if logger.isEnabledFor(logging.WARNING):  # Avoid walking the exception chain if the message would be discarded
+        logger.warning("[%d/%d, retrying in %.2fs] %s: %s",
+                       attempt, params.tries, sleep, params.failure_message, _exception_message(exception))
+
+    return sleep
+
+
+def _iter_delays(params: RetryParams) -> Iterator[Union[int, float]]:
+    """Lazily calculate the amount of sleep before each retry, capped to the maximum delay if set, without jitter.
+
+    Arguments:
+        params (wmflib.decorators.RetryParams): the already validated parameters.
+
+    Yields:
+        int, float: the sleep time in seconds, one for each retry.
+
+    """
+    base = params.delay.total_seconds()
+    max_delay = params.max_delay.total_seconds() if params.max_delay is not None else None
+    for attempt in range(1, params.tries):
+        sleep = get_backoff_sleep(params.backoff_mode, base, attempt)
+        if max_delay is not None and sleep >= max_delay:
+            # All the backoff modes are non-decreasing with validated parameters, cap all the remaining sleeps without
+            # calculating them, as they could grow enough to overflow with a large number of tries
+            yield from repeat(max_delay, params.tries - attempt)
+            return
+
+        yield sleep
+
+
+def _apply_jitter(sleep: Union[int, float], jitter: float) -> float:
+    """Apply a random jitter to the given sleep time.
+
+    Arguments:
+        sleep (int, float): the sleep time to apply the jitter to.
+        jitter (float): the maximum jitter to apply, as a fraction of the sleep time.
+
+    Returns:
+        float: the sleep time with the jitter applied.
+
+    """
+    return sleep * random.uniform(1 - jitter, 1 + jitter)  # nosec - not used for security purposes
+
+
 def _exception_message(exception: BaseException) -> str:
     """Joins the message of the given exception with those of any chained exceptions.
 
@@ -251,17 +416,28 @@ def _exception_message(exception: BaseException) -> str:
 
     """
     message_parts = [str(exception)]
-    while exception.__cause__ is not None or exception.__context__ is not None:
+    seen = {id(exception)}
+    while len(message_parts) < _MAX_CHAINED_EXCEPTIONS:
         # __cause__ and __context__ shouldn't both be set, but we use the same logic here as the built-in
         # exception handler, giving __cause__ priority, as described in PEP 3134. We list messages in
         # reverse order from the built-in handler (i.e. newest exception first) since we aren't following a
         # traceback.
         if exception.__cause__ is not None:
-            message_parts.append(f'Caused by: {exception.__cause__}')
-            exception = exception.__cause__
-        else:  # e.__context__ is not None, due to the while condition.
-            message_parts.append(f'Raised while handling: {exception.__context__}')
-            exception = cast(BaseException, exception.__context__)  # Casting away the Optional.
+            prefix = 'Caused by'
+            chained = exception.__cause__
+        elif exception.__context__ is not None:
+            prefix = 'Raised while handling'
+            chained = exception.__context__
+        else:
+            break
+
+        if id(chained) in seen:  # Python doesn't prevent cycles in the chain, stop as the built-in handler does
+            break
+
+        seen.add(id(chained))
+        message_parts.append(f'{prefix}: {chained}')
+        exception = chained
+
     return '\n'.join(message_parts)
 
 
@@ -277,15 +453,9 @@ def get_backoff_sleep(backoff_mode: str, base: Union[int, float], index: int) ->
         int, float: the amount of sleep to perform for the backoff.
 
     """
-    if backoff_mode == 'constant':
-        sleep = base
-    elif backoff_mode == 'linear':
-        sleep = base * index
-    elif backoff_mode == 'power':
-        sleep = base * 2 ** (index - 1)
-    elif backoff_mode == 'exponential':
-        sleep = base ** index
-    else:
-        raise ValueError(f'Invalid backoff_mode: {backoff_mode}')
+    try:
+        backoff = _BACKOFF_FUNCTIONS[backoff_mode]
+    except KeyError:
+        raise ValueError(f'Invalid backoff_mode: {backoff_mode}') from None
 
-    return sleep
+    return backoff(base, index)
@@ -1,7 +1,12 @@
 """DNS module."""
 import logging
+import threading
+import time
 
-from typing import cast, List, Optional, Sequence, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import cast, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 from dns import resolver, reversename, rrset
 from dns.exception import DNSException
@@ -12,6 +17,41 @@ from wmflib.exceptions import WmflibError
 
 
 logger = logging.getLogger(__name__)
+CACHE_MAX_SIZE: int = 1024
+""":py:class:`int`: the maximum number of responses kept in the cache of a :py:class:`wmflib.dns.Dns` instance."""
+NEGATIVE_CACHE_TTL: int = 5
+""":py:class:`int`: the number of seconds a not found response is kept in the cache, if the cache is enabled."""
+
+
+_HAS_RESOLVE = hasattr(resolver.Resolver, 'resolve')  # Resolver.query() was deprecated in dnspython 2.0.0
+# Shared by all the Dns instances for the AAAA lookups of resolve_ips(), the worker threads are started only when needed
+# and are joined at interpreter exit
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix='wmflib-dns')
+
+
+@lru_cache(maxsize=None)
+def _get_resolver(nameserver_addresses: Optional[Tuple[str, ...]] = None, port: Optional[int] = None
+                  ) -> resolver.Resolver:
+    """Return a resolver for the given configuration, creating it only the first time it's requested.
+
+    Arguments:
+        nameserver_addresses (tuple, optional): the nameservers address to use, if not set uses the OS configuration.
+        port (int, optional): the port the ``nameserver_addresses`` nameservers are listening to, if different from
+            the default 53. This applies only if the nameservers are explicitly specified.
+
+    Returns:
+        dns.resolver.Resolver: the resolver instance, shared between all the callers with the same configuration.
+
+    """
+    if nameserver_addresses is None:
+        return resolver.Resolver()
+
+    instance = resolver.Resolver(configure=False)
+    if port is not None:
+        instance.port = port
+    instance.nameservers = list(nameserver_addresses)
+
+    return instance
 
 
 class DnsError(WmflibError):
@@ -28,7 +68,8 @@ class DnsNotFound(DnsError):
 class Dns:
     """Class to interact with the DNS."""
 
-    def __init__(self, *, nameserver_addresses: Optional[Sequence[str]] = None, port: Optional[int] = None) -> None:
+    def __init__(self, *, nameserver_addresses: Optional[Sequence[str]] = None, port: Optional[int] = None,
+                 cache_max_ttl: int = 0) -> None:
         """Initialize the instance optionally specifying the nameservers to use.
 
         Examples:
@@ -42,20 +83,30 @@ class Dns:
                 >>> from wmflib.dns import Dns
                 >>> dns = Dns(nameserver_addresses=['10.0.0.1', '10.0.0.2'], port=5353)
 
+            Caching the responses for up to 60 seconds, honoring the TTL of the records if lower::
+
+                >>> from wmflib.dns import Dns
+                >>> dns = Dns(cache_max_ttl=60)
+
         Arguments:
             nameserver_addresses (Sequence, optional): the nameserveres address to use, if not set uses the OS
                 configuration.
             port (int, optional): the port the ``nameserver_addresses`` nameserveres is listening to, if different from
                 the default 53. This applies only if a nameserveres is explicitelyes specified.
+            cache_max_ttl (int, optional): if positive, cache the responses of :py:meth:`wmflib.dns.Dns.resolve` for
+                the TTL of the returned records, capped to this number of seconds. Not found responses are cached for
+                :py:const:`wmflib.dns.NEGATIVE_CACHE_TTL` seconds, capped to the same value. The cache holds up to
+                :py:const:`wmflib.dns.CACHE_MAX_SIZE` responses, evicting the least recently used ones. By default the
+                cache is disabled, as a cache is not suitable when polling for DNS changes.
 
         """
+        self._cache_max_ttl = cache_max_ttl
+        self._cache: 'OrderedDict[Tuple[str, str], Tuple[float, Union[resolver.Answer, DnsNotFound]]]' = OrderedDict()
+        self._cache_lock = threading.Lock()
         if nameserver_addresses is not None:
-            self._resolver = resolver.Resolver(configure=False)
-            if port is not None:
-                self._resolver.port = port
-            self._resolver.nameservers = list(nameserver_addresses)
+            self._resolver = _get_resolver(tuple(nameserver_addresses), port)
         else:
-            self._resolver = resolver.Resolver()
+            self._resolver = _get_resolver()
 
     def resolve_ipv4(self, name: str) -> List[str]:
         """Perform a DNS lookup for an A record for the given name.
@@ -96,6 +147,8 @@ class Dns:
     def resolve_ips(self, name: str) -> List[str]:
         """Perform a DNS lookup for A and AAAA records for the given name.
 
+        The two lookups are performed concurrently.
+
         Examples:
             ::
 
@@ -112,18 +165,68 @@ class Dns:
             wmflib.dns.DnsNotFound: when no address is found.
 
         """
+        # Perform the AAAA lookup in a separate thread while performing the A one in the current thread
+        ipv6_future = _EXECUTOR.submit(self.resolve_ipv6, name)
         addresses = []
-        for func in ('resolve_ipv4', 'resolve_ipv6'):
-            try:
-                addresses += getattr(self, func)(name)
-            except DnsNotFound:
-                pass  # Allow single stack answers
+        try:
+            addresses += self.resolve_ipv4(name)
+        except DnsNotFound:
+            pass  # Allow single stack answers
+        finally:
+            ipv6_exception = ipv6_future.exception()  # Always wait for the AAAA lookup to complete
+
+        if ipv6_exception is None:
+            addresses += ipv6_future.result()
+        elif not isinstance(ipv6_exception, DnsNotFound):
+            raise ipv6_exception
 
         if not addresses:
             raise DnsNotFound(f'Record A or AAAA not found for {name}')
 
         return addresses
 
+    def bulk_resolve_ips(self, names: Iterable[str], *, max_workers: int = 16) -> Dict[str, List[str]]:
+        """Perform DNS lookups for A and AAAA records for all the given names concurrently.
+
+        Examples:
+            ::
+
+                >>> dns.bulk_resolve_ips(['wikimedia.org', 'api.svc.eqiad.wmnet'])
+                {'wikimedia.org': ['208.80.154.224', '2620:0:861:ed1a::1'], 'api.svc.eqiad.wmnet': ['10.2.2.22']}
+
+        Arguments:
+            names (iterable): the names to resolve.
+            max_workers (int, optional): the maximum number of lookups to perform concurrently.
+
+        Returns:
+            dict: a dictionary with the names as keys and the list of IPv4 and IPv6 addresses as strings returned by
+            the DNS responses as values. The list is empty for the names that have no A or AAAA record.
+
+        Raises:
+            wmflib.dns.DnsError: on generic error of any of the lookups.
+
+        """
+        unique_names = list(dict.fromkeys(names))
+        if not unique_names:
+            return {}
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, 2 * len(unique_names)),
+                                thread_name_prefix='wmflib-dns-bulk') as executor:
+            futures = [(name, executor.submit(self.resolve_ipv4, name), executor.submit(self.resolve_ipv6, name))
+                       for name in unique_names]
+            for name, *name_futures in futures:
+                addresses = []
+                for future in name_futures:
+                    try:
+                        addresses += future.result()
+                    except DnsNotFound:
+                        pass  # Allow single stack answers and missing records
+
+                results[name] = addresses
+
+        return results
+
     def resolve_ptr(self, address: str) -> List[str]:
         """Perform a DNS lookup for PTR record for the given address.
 
@@ -187,9 +290,48 @@ class Dns:
                 different record type(s).
             wmflib.dns.DnsError: on generic error.
 
+        """
+        if self._cache_max_ttl <= 0:
+            return self._query(qname, record_type)
+
+        key = (str(qname), record_type)
+        cached = self._get_cached(key)
+        if cached is not None:
+            if isinstance(cached, DnsNotFound):
+                raise DnsNotFound(str(cached)) from cached.__cause__
+
+            return cached
+
+        try:
+            response = self._query(qname, record_type)
+        except DnsNotFound as e:
+            self._set_cached(key, e, NEGATIVE_CACHE_TTL)
+            raise
+
+        self._set_cached(key, response, response.ttl)
+        return response
+
+    def _query(self, qname: Union[str, Name], record_type: str) -> resolver.Answer:
+        """Perform the actual DNS query for the given qname and record type, see :py:meth:`wmflib.dns.Dns.resolve`.
+
+        Arguments:
+            qname (str): the name or address to resolve.
+            record_type (str): the DNS record type to lookup for, like 'A', 'AAAA', 'PTR', etc.
+
+        Returns:
+            dns.resolver.Answer: the DNS response.
+
+        Raises:
+            wmflib.dns.DnsNotFound: if there are no records for the given record type.
+            wmflib.dns.DnsError: on generic error.
+
         """
         try:
-            response = self._resolver.query(qname, record_type)
+            if _HAS_RESOLVE:
+                # Keep using the search list for relative names, as query() did by default
+                response = self._resolver.resolve(qname, record_type, search=True)
+            else:  # pragma: no cover - only for dnspython < 2.0.0
+                response = self._resolver.query(qname, record_type)
             logger.debug('Resolved %s record for %s: %s', record_type, qname, response.rrset)
         except (resolver.NoAnswer, resolver.NXDOMAIN) as e:
             raise DnsNotFound(f'Record {record_type} not found for {qname}') from e
@@ -198,6 +340,48 @@ class Dns:
 
         return response
 
+    def _get_cached(self, key: Tuple[str, str]) -> Optional[Union[resolver.Answer, DnsNotFound]]:
+        """Get the cached response for the given key, if present and not expired.
+
+        Arguments:
+            key (tuple): the cache key, a tuple with the qname and the record type.
+
+        Returns:
+            dns.resolver.Answer, wmflib.dns.DnsNotFound, None: the cached response, the cached not found exception or
+            :py:data:`None` if there is no valid cached response.
+
+        """
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+
+            if entry[0] <= time.monotonic():
+                del self._cache[key]
+                return None
+
+            self._cache.move_to_end(key)
+            return entry[1]
+
+    def _set_cached(self, key: Tuple[str, str], value: Union[resolver.Answer, DnsNotFound], ttl: int) -> None:
+        """Cache the given response for the given TTL, capped to the maximum TTL, evicting old entries if needed.
+
+        Arguments:
+            key (tuple): the cache key, a tuple with the qname and the record type.
+            value (dns.resolver.Answer, wmflib.dns.DnsNotFound): the response or not found exception to cache.
+            ttl (int): the TTL in seconds of the response.
+
+        """
+        ttl = min(ttl, self._cache_max_ttl)
+        if ttl <= 0:
+            return
+
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic() + ttl, value)
+            self._cache.move_to_end(key)
+            while len(self._cache) > CACHE_MAX_SIZE:
+                self._cache.popitem(last=False)
+
     def _resolve_addresses(self, name: str, record_type: str) -> List[str]:
         """Extract and return all the matching addresses for the given name and record type.
 
@@ -225,15 +409,11 @@ class Dns:
             wmflib.dns.DnsError: if a relative record is found.
 
         """
-        targets = []
-        for rdata in response_set:
-            target = rdata.target.to_text()
-            if target[-1] != '.':
-                raise DnsError(f'Unsupported relative target {target} found')
-
-            targets.append(target[:-1])
+        relative = [rdata.target.to_text() for rdata in response_set if not rdata.target.is_absolute()]
+        if relative:
+            raise DnsError(f'Unsupported relative target {relative[0]} found')
 
-        return targets
+        return [rdata.target.to_text(omit_final_dot=True) for rdata in response_set]
 
 
 class PublicAuthDns(Dns):
@@ -1,17 +1,23 @@
 """File I/O module."""
 import fcntl
 import logging
+import random
+import signal
+import threading
+import time
 
 from contextlib import contextmanager
-from datetime import timedelta
 from os import PathLike
-from typing import Generator, IO
+from types import FrameType
+from typing import Generator, IO, Optional
 
-from wmflib.decorators import retry
 from wmflib.exceptions import WmflibError
 
 
 logger = logging.getLogger(__name__)
+_LOCK_FLAGS = fcntl.LOCK_EX | fcntl.LOCK_NB
+_LOCK_MIN_DELAY = 0.005  # Initial delay in seconds between the attempts to acquire a lock, doubled at each attempt
+_LOCK_MAX_DELAY = 0.5  # Maximum delay in seconds between the attempts to acquire a lock
 
 
 class FileIOError(WmflibError):
@@ -23,7 +29,8 @@ class LockError(FileIOError):
 
 
 @contextmanager
-def locked_open(file_path: PathLike, file_mode: str = 'r', *, timeout: int = 10) -> Generator[IO, None, None]:
+def locked_open(file_path: PathLike, file_mode: str = 'r', *, timeout: float = 10,
+                use_alarm: bool = False) -> Generator[IO, None, None]:
     """Context manager to open a file with an exclusive lock on it and a retry logic.
 
     Examples:
@@ -39,8 +46,15 @@ def locked_open(file_path: PathLike, file_mode: str = 'r', *, timeout: int = 10)
     Arguments:
         file_path (os.PathLike): the file path to open.
         file_mode (str, optional): the mode in which the file is opened, see :py:func:`open` for details.
-        timeout (int, optional): the total timeout in seconds to wait to acquire the exclusive lock before giving up.
-            Ten tries will be attempted to acquire the lock within the timeout.
+        timeout (float, optional): the total timeout in seconds to wait to acquire the exclusive lock before giving up.
+            The attempts to acquire the lock are retried with a randomized exponential backoff within the timeout.
+        use_alarm (bool, optional): whether to wait for the lock with a blocking call interrupted by a timer on
+            timeout instead, to acquire the lock as soon as it's released. This affects the whole process: while
+            waiting, the ``SIGALRM`` handler is replaced and the ``ITIMER_REAL`` real time interval timer is armed,
+            hence the caller must not use :py:func:`signal.alarm`, :py:func:`signal.setitimer` or rely on its own
+            ``SIGALRM`` handler during the wait, and the :py:class:`wmflib.fileio.LockError` on timeout is raised from
+            the signal handler. It's used only when called from the main thread with no ``ITIMER_REAL`` timer already
+            set, falling back to the backoff otherwise.
 
     Raises:
         wmflib.fileio.LockError: on failure to acquire the exclusive lock on the file.
@@ -49,24 +63,130 @@ def locked_open(file_path: PathLike, file_mode: str = 'r', *, timeout: int = 10)
         file object: the open file with an exclusive lock on it.
 
     """
-    tries = 10
     with open(file_path, file_mode, encoding='utf-8') as fd:
-        try:
-            # Decorate the call to the locking function to retry acquiring the lock:
-            # decorator(decorator_args)(function)(function_args)
-            # no-value-for-parameter is needed because pylint is confused by @ensure_wraps
-            retry(  # pylint: disable=no-value-for-parameter
-                tries=tries,
-                delay=timedelta(seconds=timeout / tries),
-                backoff_mode='constant',
-                exceptions=(OSError, BlockingIOError)
-            )(fcntl.flock)(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
-            logger.debug('Acquired exclusive lock on %s', file_path)
-        except OSError as e:
-            raise LockError(f'Unable to acquire exclusive lock on {file_path}') from e
+        _acquire_lock(fd, file_path, timeout, use_alarm)
 
         try:
             yield fd
         finally:
             fcntl.flock(fd, fcntl.LOCK_UN)
             logger.debug('Released exclusive lock on %s', file_path)
+
+
+def _acquire_lock(fd: IO, file_path: PathLike, timeout: float, use_alarm: bool) -> None:
+    """Acquire an exclusive lock on the given open file, waiting up to the given timeout if already locked.
+
+    Arguments:
+        fd (file object): the open file to lock.
+        file_path (os.PathLike): the file path, used only for logging.
+        timeout (float): the total timeout in seconds to wait to acquire the exclusive lock before giving up.
+        use_alarm (bool): whether to wait with a blocking call interrupted by a timer, if possible.
+
+    Raises:
+        wmflib.fileio.LockError: on failure to acquire the exclusive lock on the file within the timeout.
+
+    """
+    try:  # Fast path, the lock is not contended
+        fcntl.flock(fd, _LOCK_FLAGS)
+        logger.debug('Acquired exclusive lock on %s', file_path)
+        return
+    except OSError as e:
+        if timeout <= 0:
+            raise LockError(f'Unable to acquire exclusive lock on {file_path}') from e
+
+    if use_alarm and _can_use_alarm():
+        _acquire_lock_with_alarm(fd, file_path, timeout)
+    else:
+        _acquire_lock_with_backoff(fd, file_path, timeout)
+
+
+def _can_use_alarm() -> bool:
+    """Check if a real time interval timer can be used to interrupt a blocking call.
+
+    The SIGALRM signal is delivered only to the main thread and there must not be any timer already set by the caller.
+
+    Returns:
+        bool: :py:data:`True` if the interval timer can be used, :py:data:`False` otherwise.
+
+    """
+    return (threading.current_thread() is threading.main_thread()
+            and signal.getsignal(signal.SIGALRM) is not None  # None means not installed from Python
+            and signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0))
+
+
+def _acquire_lock_with_alarm(fd: IO, file_path: PathLike, timeout: float) -> None:
+    """Acquire an exclusive lock on the given open file with a blocking call interrupted by a timer on timeout.
+
+    The process is woken up by the kernel as soon as the lock is released.
+
+    Arguments:
+        fd (file object): the open file to lock.
+        file_path (os.PathLike): the file path, used only for logging.
+        timeout (float): the total timeout in seconds to wait to acquire the exclusive lock before giving up.
+
+    Raises:
+        wmflib.fileio.LockError: on failure to acquire the exclusive lock on the file within the timeout.
+
+    """
+    acquired = False
+
+    def handler(_signum: int, _frame: Optional[FrameType]) -> None:
+        """Interrupt the blocking call, unless the lock was already acquired."""
+        if not acquired:
+            raise LockError(f'Unable to acquire exclusive lock on {file_path} within {timeout} seconds')
+
+    previous_handler = signal.signal(signal.SIGALRM, handler)
+    try:
+        try:
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            acquired = True
+        finally:  # Always disarm the timer before restoring the previous handler
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    except LockError:
+        # The timer might have expired right after the lock was acquired, before it was recorded
+        try:
+            fcntl.flock(fd, _LOCK_FLAGS)
+            acquired = True
+        except OSError:
+            pass
+
+        if not acquired:
+            raise
+    except OSError as e:
+        raise LockError(f'Unable to acquire exclusive lock on {file_path}') from e
+    finally:
+        signal.signal(signal.SIGALRM, previous_handler)
+
+    logger.debug('Acquired exclusive lock on %s', file_path)
+
+
+def _acquire_lock_with_backoff(fd: IO, file_path: PathLike, timeout: float) -> None:
+    """Acquire an exclusive lock on the given open file, retrying with a randomized exponential backoff.
+
+    Arguments:
+        fd (file object): the open file to lock.
+        file_path (os.PathLike): the file path, used only for logging.
+        timeout (float): the total timeout in seconds to wait to acquire the exclusive lock before giving up.
+
+    Raises:
+        wmflib.fileio.LockError: on failure to acquire the exclusive lock on the file within the timeout.
+
+    """
+    deadline = time.monotonic() + timeout
+    delay = _LOCK_MIN_DELAY
+    attempts = 1
+    while True:
+        try:
+            fcntl.flock(fd, _LOCK_FLAGS)
+            break
+        except OSError as e:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise LockError(f'Unable to acquire exclusive lock on {file_path}') from e
+
+        time.sleep(min(delay * random.uniform(0.5, 1.5), remaining))  # nosec
+        delay = min(delay * 2, _LOCK_MAX_DELAY)
+        attempts += 1
+
+    logger.debug('Acquired exclusive lock on %s after %d attempt(s)', file_path, attempts)
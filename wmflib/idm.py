@@ -1,12 +1,14 @@
 """Base module IDM related classes and functions."""
 
 from abc import ABC, abstractmethod
-from argparse import ArgumentParser, Namespace
-from logging import getLogger
-from typing import List, Optional
+from logging import getLogger, Logger
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
 
 from wmflib.exceptions import WmflibError
 
+if TYPE_CHECKING:  # pragma: no cover - only for static type checkers
+    from argparse import Namespace
+
 
 class IdmValueError(WmflibError):
     """Raised by the IDM module value errors."""
@@ -14,7 +16,7 @@ class IdmValueError(WmflibError):
 
 # We make the description optional to deal with the following issue
 # https://github.com/python/mypy/issues/9170
-def logoutd_args(description: Optional[str] = None, args: Optional[List] = None) -> Namespace:
+def logoutd_args(description: Optional[str] = None, args: Optional[List] = None) -> 'Namespace':
     """Logout scripts common CLI for parsing the command line arguments.
 
     When not using the higher level API :py:class:`wmflib.idm.LogoutdBase`, a user could just implement their own
@@ -35,6 +37,8 @@ def logoutd_args(description: Optional[str] = None, args: Optional[List] = None)
     if description is None:
         raise IdmValueError('Must provide a string description')
 
+    from argparse import ArgumentParser  # pylint: disable=import-outside-toplevel; Imported lazily, only when needed
+
     parser = ArgumentParser(description=description)
     parser.add_argument('-v', '--verbose', action='count', default=0)
     sub = parser.add_subparsers(dest='command', required=True)
@@ -84,6 +88,23 @@ class LogoutdBase(ABC):  # noqa: D300,D301 See https://github.com/PyCQA/pydocsty
     """
 
     user_identifier: str = 'cn'
+    _logger: Logger
+    # The lambdas resolve the methods on the instance, honoring the subclasses implementations
+    _commands: Dict[str, Callable[['LogoutdBase'], int]] = {
+        'query': lambda self: self.query_user(self.user),
+        'logout': lambda self: self.logout_user(self.user),
+        'list': lambda self: self.list(),
+    }
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Set the logger once for each subclass, as it's the same for all its instances.
+
+        Arguments:
+            **kwargs (mixed): the keyword arguments to pass to the parent's method.
+
+        """
+        super().__init_subclass__(**kwargs)
+        cls._logger = getLogger('.'.join((cls.__module__, cls.__name__)))
 
     def __init__(self, args: Optional[List] = None) -> None:
         """Init function.
@@ -93,7 +114,6 @@ class LogoutdBase(ABC):  # noqa: D300,D301 See https://github.com/PyCQA/pydocsty
 
         """
         self._args = logoutd_args(self.__doc__, args)
-        self._logger = getLogger('.'.join((self.__module__, self.__class__.__name__)))
 
     @property
     def user(self) -> str:
@@ -146,8 +166,4 @@ class LogoutdBase(ABC):  # noqa: D300,D301 See https://github.com/PyCQA/pydocsty
 
         """
         self._logger.debug('Running action: %s', self._args.command)
-        if self._args.command == 'query':
-            return self.query_user(self.user)
-        if self._args.command == 'logout':
-            return self.logout_user(self.user)
-        return self.list()
+        return self._commands[self._args.command](self)
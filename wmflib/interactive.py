@@ -3,14 +3,28 @@ import getpass
 import logging
 import os
 import sys
+import termios
 
-from typing import Any, Callable, Optional, Sequence
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Generator, Optional, Sequence, TextIO, Tuple
 
 from wmflib.exceptions import WmflibError
 
 
 logger = logging.getLogger(__name__)
 MIN_SECRET_SIZE: int = 6
+CONFIRM_CACHE_SIZE: int = 128
+""":py:class:`int`: the maximum number of skipped calls remembered by :py:func:`confirm_on_failure_remember_skip`."""
+_DURABLE_TERM_PREFIXES = frozenset(('screen', 'tmux'))  # TERM values like screen, screen.xterm-256color, tmux-256color
+_PREFIX = '\x1b[36m==>\x1b[39m '  # Cyan ==> prefix
+_PREFIX_BYTES = _PREFIX.encode()
+_CONFIRM_CHOICES = ('go', 'abort')
+_CONFIRM_MESSAGE = 'Type "go" to proceed or "abort" to interrupt the execution'
+_RETRY_CHOICES = ('retry', 'skip', 'abort')
+_RETRY_MESSAGE = ('What do you want to do? "retry" the last command, manually fix the issue and "skip" the last '
+                  'command to continue the execution or completely "abort" the execution.')
+_skipped_calls: 'OrderedDict[Tuple[Any, ...], None]' = OrderedDict()  # The remembered skipped calls
 
 
 class InputError(WmflibError):
@@ -21,6 +35,54 @@ class AbortError(WmflibError):
     """Custom exception class raised when an action is manually aborted."""
 
 
+def _is_tty(stream: TextIO) -> bool:
+    """Check if the given stream is a TTY.
+
+    Arguments:
+        stream (file object): the stream to check, usually :py:data:`sys.stdout`.
+
+    Returns:
+        bool: :py:data:`True` if the stream is a TTY, :py:data:`False` otherwise.
+
+    """
+    # pylint: disable-next=no-member,useless-suppression; https://github.com/prospector-dev/prospector/issues/677
+    return stream.isatty()
+
+
+def _is_durable_session() -> bool:
+    """Check if running inside a screen or tmux session.
+
+    Returns:
+        bool: :py:data:`True` if running inside a screen or tmux session, :py:data:`False` otherwise.
+
+    """
+    # STY is for screen, TMUX is for tmux. Not using `get('NAME') is not None` to check they are not empty.
+    # TODO: verify if the check on TERM is redundant.
+    env = os.environ
+    if env.get('STY', '') or env.get('TMUX', ''):
+        return True
+
+    return env.get('TERM', '').partition('-')[0].partition('.')[0] in _DURABLE_TERM_PREFIXES
+
+
+def _print_prefixed(message: str) -> None:
+    """Print the given message to stdout with the cyan ==> prefix, writing directly the bytes if possible.
+
+    Arguments:
+        message (str): the message to print.
+
+    """
+    stream = sys.stdout
+    buffer = getattr(stream, 'buffer', None)
+    if buffer is None:  # stdout was replaced with a text only stream
+        print(f'{_PREFIX}{message}')
+        return
+
+    stream.flush()  # Preserve the ordering with any text already written to stdout
+    buffer.write(_PREFIX_BYTES + message.encode(stream.encoding or 'utf-8', errors='replace') + b'\n')
+    buffer.flush()
+
+
 def ask_input(message: str, choices: Sequence[str], *, validator: Optional[Callable[[str], None]] = None) -> str:
     """Ask the user for input in interactive mode. Can be used with a list of valid answers or a custom validator.
 
@@ -73,25 +135,25 @@ def ask_input(message: str, choices: Sequence[str], *, validator: Optional[Calla
     if validator is not None and choices:
         raise InputError('When the `validator` argument is set, the `choices` argument must be empty.')
 
-    # pylint: disable-next=no-member,useless-suppression; https://github.com/prospector-dev/prospector/issues/677
-    if not sys.stdout.isatty():
+    if not _is_tty(sys.stdout):
         raise InputError('Not in a TTY, unable to ask for input')
 
-    prefix = '\x1b[36m==>\x1b[39m'  # Cyan ==> prefix
-    print(f'{prefix} {message}')
+    _print_prefixed(message)
 
+    valid_choices = frozenset(choices)
     message = f'Please type one of: {",".join(choices)}'
+    invalid_template = 'Invalid response. {message}. After 3 wrong answers the task will be aborted.'
     for _ in range(3):
         try:
             response = input('> ')
 
-            if validator is not None:
-                validator(response)
-                # Log only if the answer is valid to prevent leaks, the validator must raise for invalid values
-                logger.info('User input is: "%s"', response)
-                return response
+            if validator is None:
+                is_valid = response in valid_choices
+            else:
+                validator(response)  # The validator must raise for invalid values
+                is_valid = True
 
-            if response in choices:
+            if is_valid:
                 logger.info('User input is: "%s"', response)  # Log only if the answer is valid to prevent leaks
                 return response
 
@@ -101,7 +163,7 @@ def ask_input(message: str, choices: Sequence[str], *, validator: Optional[Calla
             if validator is not None:
                 message = str(e)
 
-        print(f'{prefix} Invalid response. {message}. After 3 wrong answers the task will be aborted.')
+        _print_prefixed(invalid_template.format(message=message))
 
     raise InputError('Too many invalid answers')
 
@@ -134,8 +196,7 @@ def ask_confirmation(message: str) -> None:
         wmflib.interactive.AbortError: if manually aborted.
 
     """
-    response = ask_input('\n'.join((message, 'Type "go" to proceed or "abort" to interrupt the execution')),
-                         ['go', 'abort'])
+    response = ask_input(f'{message}\n{_CONFIRM_MESSAGE}', _CONFIRM_CHOICES)
     if response == 'abort':
         raise AbortError('Confirmation manually aborted')
 
@@ -173,22 +234,90 @@ def confirm_on_failure(func: Callable, *args: Any, **kwargs: Any) -> Any:
 
     Raises:
         wmflib.interactive.AbortError: on manually aborted tasks.
+        SystemExit: if raised by the function/method, without asking the user. A :py:exc:`KeyboardInterrupt` instead
+            is treated as any other failure, to allow to interrupt a stuck call and retry or skip it.
+
+    """
+    return _confirm_on_failure(func, args, kwargs, None)
+
+
+def confirm_on_failure_remember_skip(func: Callable, *args: Any, **kwargs: Any) -> Any:
+    """Execute a function like :py:func:`wmflib.interactive.confirm_on_failure`, remembering the decisions to skip it.
+
+    When the same failing call is expected to be repeated in the same session, for example when replaying failures in
+    scripted runs, a decision to skip a call is remembered and any subsequent call with the same function/method and
+    arguments is skipped without executing it and without prompting. Bound methods of different instances are
+    different calls. The remembered decisions are bounded to the last
+    :py:const:`wmflib.interactive.CONFIRM_CACHE_SIZE` ones. Calls with unhashable arguments are never remembered.
+
+    Examples:
+        ::
+
+            >>> confirm_on_failure_remember_skip(test, fail=True)
+            Failed to run __main__.test: Failed
+            ==> What do you want to do? "retry" the last command, manually fix the issue and "skip" the last command to
+                continue the execution or completely "abort" the execution.
+            > skip
+            >>> confirm_on_failure_remember_skip(test, fail=True)  # Skipped without executing it
+            >>>
+
+    Arguments:
+        func (callable): the function/method to execute.
+        *args (mixed): all the positional arguments to pass to the function/method.
+        *kwargs (mixed): all the keyword arguments to pass to the function/method.
+
+    Returns:
+        mixed: what the called function returns, or :py:data:`None` if the execution should continue skipping this
+        step because has been manually fixed or was previously skipped.
+
+    Raises:
+        wmflib.interactive.AbortError: on manually aborted tasks.
+        SystemExit: if raised by the function/method, without asking the user.
 
     """
-    retry_message = ('What do you want to do? "retry" the last command, manually fix the issue and "skip" the last '
-                     'command to continue the execution or completely "abort" the execution.')
-    choices = ['retry', 'skip', 'abort']
+    key = (func, args, tuple(sorted(kwargs.items())))
+    try:
+        if key in _skipped_calls:
+            logger.info('Skipping %s.%s as previously requested', func.__module__, func.__qualname__)
+            _skipped_calls.move_to_end(key)
+            return None
+    except TypeError:  # Unhashable function/method or arguments
+        return _confirm_on_failure(func, args, kwargs, None)
+
+    return _confirm_on_failure(func, args, kwargs, key)
+
 
+def _confirm_on_failure(func: Callable, args: Tuple[Any, ...], kwargs: Dict[str, Any],
+                        key: Optional[Tuple[Any, ...]]) -> Any:
+    """Execute a function asking for confirmation to retry, abort or skip, remembering the skip if a key is given.
+
+    Arguments:
+        func (callable): the function/method to execute.
+        args (tuple): the positional arguments to pass to the function/method.
+        kwargs (dict): the keyword arguments to pass to the function/method.
+        key (tuple, None): the key to remember a decision to skip the call with, :py:data:`None` to not remember it.
+
+    Returns:
+        mixed: what the called function returns, or :py:data:`None` if the call was skipped.
+
+    Raises:
+        wmflib.interactive.AbortError: on manually aborted tasks.
+
+    """
     while True:
         try:
             ret = func(*args, **kwargs)
-        except AbortError:
+        except (AbortError, SystemExit):  # Explicit requests to stop the execution, don't ask to retry them
             raise
         except BaseException as e:  # pylint: disable=broad-except
             logger.error('Failed to run %s.%s: %s', func.__module__, func.__qualname__, e)
             logger.debug('Traceback', exc_info=True)
-            response = ask_input(retry_message, choices)
+            response = ask_input(_RETRY_MESSAGE, _RETRY_CHOICES)
             if response == 'skip':
+                if key is not None:
+                    _skipped_calls[key] = None
+                    if len(_skipped_calls) > CONFIRM_CACHE_SIZE:
+                        _skipped_calls.popitem(last=False)
                 return None
             if response == 'abort':
                 raise AbortError('Task manually aborted') from e
@@ -209,8 +338,9 @@ def get_username() -> str:
         str: the name of the effective running user or ``-`` if unable to detect it.
 
     """
-    user = os.getenv('USER')
-    sudo_user = os.getenv('SUDO_USER')
+    env = os.environ
+    user = env.get('USER')
+    sudo_user = env.get('SUDO_USER')
 
     if sudo_user is not None and sudo_user != 'root':
         return sudo_user
@@ -234,10 +364,7 @@ def ensure_shell_is_durable() -> None:
         wmflib.exceptions.WmflibError: if in a non-durable shell session.
 
     """
-    # STY is for screen, TMUX is for tmux. Not using `getenv('NAME') is not None` to check they are not empty.
-    # TODO: verify if the check on TERM is redundant.
-    if (sys.stdout.isatty() and not os.getenv('STY', '') and not os.getenv('TMUX', '')
-            and 'screen' not in os.getenv('TERM', '') and 'tmux' not in os.getenv('TERM', '')):
+    if _is_tty(sys.stdout) and not _is_durable_session():
         raise WmflibError('Must be run in non-interactive mode or inside a screen or tmux.')
 
 
@@ -266,13 +393,103 @@ def get_secret(title: str, *, confirm: bool = False) -> str:
         wmflib.exceptions.WmflibError: if the password confirmation does not match and confirm is :py:data:`True`.
 
     """
-    new_secret = getpass.getpass(prompt=f'{title}: ')
+    retry_prompt = f'Secret must be at least {MIN_SECRET_SIZE} characters. try again: '
+    with _secret_reader() as read_secret:
+        new_secret = read_secret(f'{title}: ')
 
-    while len(new_secret) < MIN_SECRET_SIZE:
-        new_secret = getpass.getpass(
-            prompt=f'Secret must be at least {MIN_SECRET_SIZE} characters. try again: ')
+        while len(new_secret) < MIN_SECRET_SIZE:
+            new_secret = read_secret(retry_prompt)
 
-    if confirm and new_secret != getpass.getpass(prompt='Again, just to be sure: '):
-        raise WmflibError(f'{title}: Passwords did not match')
+        if confirm and new_secret != read_secret('Again, just to be sure: '):
+            raise WmflibError(f'{title}: Passwords did not match')
 
     return new_secret
+
+
+def _open_tty() -> Optional[int]:
+    """Open the controlling terminal of the process.
+
+    Returns:
+        int: the file descriptor of the controlling terminal or :py:data:`None` if there is none.
+
+    """
+    try:
+        return os.open('/dev/tty', os.O_RDWR | os.O_NOCTTY)
+    except OSError:
+        return None
+
+
+def _read_stdin_secret(prompt: str) -> str:
+    """Read a secret from a non-interactive standard input, showing the prompt on the standard error.
+
+    Arguments:
+        prompt (str): the prompt to show.
+
+    Returns:
+        str: the secret read, without the trailing newline.
+
+    Raises:
+        EOFError: if the standard input has no more data, as :py:func:`getpass.getpass` does.
+
+    """
+    sys.stderr.write(prompt)
+    sys.stderr.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+
+    return line.rstrip('\n')
+
+
+@contextmanager
+def _secret_reader() -> Generator[Callable[[str], str], None, None]:
+    """Context manager to read multiple secrets from the controlling terminal opening it and disabling echo once.
+
+    Falls back to :py:func:`getpass.getpass` for each secret if there is no usable controlling terminal, or to read
+    directly from the standard input if it's not interactive either, without the getpass warning.
+
+    Yields:
+        callable: a function that accepts the prompt to show as its only argument and returns the secret read.
+
+    """
+    tty_fd = _open_tty()
+    if tty_fd is not None:
+        try:
+            old_attributes = termios.tcgetattr(tty_fd)
+        except termios.error:  # Not a terminal
+            os.close(tty_fd)
+            tty_fd = None
+
+    if tty_fd is None:
+        if sys.stdin.isatty():
+            yield lambda prompt: getpass.getpass(prompt=prompt)
+        else:
+            yield _read_stdin_secret
+        return
+
+    pending = bytearray()  # Any data already read after the last returned line
+
+    def read_secret(prompt: str) -> str:
+        """Show the prompt and read a line from the terminal."""
+        os.write(tty_fd, prompt.encode())
+        while b'\n' not in pending:
+            chunk = os.read(tty_fd, 1024)
+            if not chunk:  # EOF, raise as getpass does
+                os.write(tty_fd, b'\n')
+                raise EOFError
+
+            pending.extend(chunk)
+
+        line, _, rest = pending.partition(b'\n')
+        pending[:] = rest
+        os.write(tty_fd, b'\n')  # The newline typed by the user is not echoed
+        return line.decode()
+
+    new_attributes = list(old_attributes)
+    new_attributes[3] &= ~termios.ECHO  # Disable echo in the local modes
+    try:
+        termios.tcsetattr(tty_fd, termios.TCSAFLUSH, new_attributes)
+        yield read_secret
+    finally:
+        termios.tcsetattr(tty_fd, termios.TCSAFLUSH, old_attributes)
+        os.close(tty_fd)
@@ -50,15 +50,16 @@ class SocketHandler(logging.Handler):
         self.username = username
         self.level = logging.INFO
         self.hostname = socket.gethostname()
+        self._prefix = f'{self.command} {self.username}@{self.hostname} '.encode('utf-8')
 
-    def _send_message(self, message: str, record: logging.LogRecord) -> None:
-        """Send a custom message string on a socket."""
+    def _send_message(self, message: bytes, record: logging.LogRecord) -> None:
+        """Send a custom already encoded message on a new connection to tcpircbot."""
         sock = None
         try:
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             sock.settimeout(1.0)
             sock.connect(self.addr)
-            sock.sendall(message.encode('utf-8'))
+            sock.sendall(message)
         except OSError:
             self.handleError(record)
         finally:
@@ -70,7 +71,7 @@ class SocketHandler(logging.Handler):
 
         See https://docs.python.org/3/library/logging.html#handler-objects
         """
-        self._send_message(f'{self.command} {self.username}@{self.hostname} {self.format(record)}'.strip(), record)
+        self._send_message((self._prefix + self.format(record).encode('utf-8')).strip(), record)
 
 
 class SALSocketHandler(SocketHandler):
@@ -1,13 +1,20 @@
 """Phabricator module."""
 import configparser
 import logging
+import os
+
+from typing import Dict, Tuple
 
 import phabricator
 
+from wmflib.config import load_ini_config
 from wmflib.exceptions import WmflibError
 
 
 logger = logging.getLogger(__name__)
+_REQUIRED_OPTIONS = ('host', 'username', 'token')
+# Required options already read from the bot config files, keyed by (absolute path, section), with the mtime of the file
+_CONFIG_CACHE: Dict[Tuple[str, str], Tuple[int, Tuple[str, ...]]] = {}
 
 
 def create_phabricator(
@@ -24,6 +31,9 @@ def create_phabricator(
             phab_client = create_phabricator('/path/to/config.ini')
             phab_client.task_comment('T12345', 'Message')
 
+    The required options read from the bot config file are cached, and the file is parsed again only if modified
+    since the last call.
+
     Arguments:
         bot_config_file (str): the path to the configuration file for the Phabricator bot, with the following
             structure::
@@ -45,19 +55,7 @@ def create_phabricator(
             file, or to initialize the Phabricator client.
 
     """
-    parser = configparser.ConfigParser()
-    parser.read(bot_config_file)
-    required_options = ('host', 'username', 'token')
-    params = {}
-
-    try:
-        for option in required_options:
-            params[option] = parser.get(section, option)
-    except configparser.NoSectionError as e:
-        raise PhabricatorError(f'Unable to find section {section} in config file {bot_config_file}') from e
-    except configparser.NoOptionError as e:
-        raise PhabricatorError(f'Unable to find all required options {required_options} in section {section} of config '
-                               f'file {bot_config_file}') from e
+    params = dict(zip(_REQUIRED_OPTIONS, _get_bot_config(bot_config_file, section)))
 
     try:
         client = phabricator.Phabricator(**params)
@@ -67,6 +65,44 @@ def create_phabricator(
     return Phabricator(client, dry_run=dry_run)
 
 
+def _get_bot_config(bot_config_file: str, section: str) -> Tuple[str, ...]:
+    """Get the required options from the bot config file, parsing it only if modified since the last call.
+
+    Arguments:
+        bot_config_file (str): the path to the configuration file for the Phabricator bot.
+        section (str): the name of the section of the configuration file where to find the required options.
+
+    Returns:
+        tuple: the values of the host, username and token options, in this order.
+
+    Raises:
+        wmflib.phabricator.PhabricatorError: if unable to load the bot configuration file or to get all the required
+            options from it.
+
+    """
+    try:
+        mtime = os.stat(bot_config_file).st_mtime_ns
+        cache_key = (os.path.abspath(bot_config_file), section)
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        parser = load_ini_config(bot_config_file)
+    except (OSError, WmflibError) as e:
+        raise PhabricatorError(f'Unable to load config file {bot_config_file}: {e}') from e
+
+    try:
+        values = tuple(parser.get(section, option) for option in _REQUIRED_OPTIONS)
+    except configparser.NoSectionError as e:
+        raise PhabricatorError(f'Unable to find section {section} in config file {bot_config_file}') from e
+    except configparser.NoOptionError as e:
+        raise PhabricatorError(f'Unable to find all required options {_REQUIRED_OPTIONS} in section {section} of '
+                               f'config file {bot_config_file}') from e
+
+    _CONFIG_CACHE[cache_key] = (mtime, values)
+    return values
+
+
 class PhabricatorError(WmflibError):
     """Custom exception class for errors of the Phabricator class."""
 
@@ -74,6 +110,8 @@ class PhabricatorError(WmflibError):
 class Phabricator:
     """Class to interact with a Phabricator website."""
 
+    __slots__ = ('_client', '_dry_run')
+
     def __init__(self, phabricator_client: phabricator.Phabricator, dry_run: bool = True) -> None:
         """Initialize the Phabricator client from the bot config file.
 
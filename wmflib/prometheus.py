@@ -1,28 +1,73 @@
 """Prometheus module."""
 
+import json
 import logging
 
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List
 
 import requests
 
-from wmflib.constants import ALL_DATACENTERS
+from wmflib.constants import ALL_DATACENTERS, ALL_DATACENTERS_SET
 from wmflib.exceptions import WmflibError
 from wmflib.requests import http_session, TimeoutType
 
 logger = logging.getLogger(__name__)
+# Use the orjson parser when installed, it's much faster than the standard library one on large results
+_json_loads: Callable[[bytes], Any]
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on the installed packages
+    _json_loads = json.loads
+# HTTP sessions shared by all the instances of the same class, to reuse the open connections, keyed by the class name
+_HTTP_SESSIONS: Dict[str, requests.Session] = {}
 
 
 class PrometheusError(WmflibError):
     """Custom exception class for errors of this module."""
 
 
+@lru_cache(maxsize=64)
+def _get_prometheus_url(template: str, site: str, instance: str) -> str:
+    """Return the Prometheus API URL for the given site and instance, caching the valid ones.
+
+    Arguments:
+        template (str): the URL template with the ``site`` and ``instance`` placeholders.
+        site (str): The site to use for queries. Must be one of :py:const:`wmflib.constants.ALL_DATACENTERS`
+        instance (str): The prometheus instance to query on the given site.
+
+    Returns:
+        str: the URL to query.
+
+    Raises:
+        wmflib.prometheus.PrometheusError: if the site is not valid.
+
+    """
+    if site not in ALL_DATACENTERS_SET:
+        msg = f'site ({site}) must be one of wmflib.constants.ALL_DATACENTERS {ALL_DATACENTERS}'
+        raise PrometheusError(msg)
+
+    return template.format(site=site, instance=instance)
+
+
 class PrometheusBase:
     """Base class to interact with Prometheus-like APIs."""
 
+    __slots__ = ('_http_session',)
+
     def __init__(self) -> None:
-        """Initialize the instance."""
-        self._http_session = http_session('.'.join((self.__module__, self.__class__.__name__)))
+        """Initialize the instance.
+
+        All the instances of the same class share the same HTTP session, reusing its pool of connections.
+        """
+        name = '.'.join((self.__module__, self.__class__.__name__))
+        session = _HTTP_SESSIONS.get(name)
+        if session is None:
+            session = _HTTP_SESSIONS[name] = http_session(name)
+
+        self._http_session = session
 
     def _query(self, url: str, params: Dict[str, str], timeout: TimeoutType) -> List[Dict]:
         """Perform a generic query.
@@ -45,12 +90,39 @@ class PrometheusBase:
         if response.status_code != requests.codes['ok']:
             raise PrometheusError(f'Unable to get metric: HTTP {response.status_code}: {response.text}')
 
-        result = response.json()
+        result = _json_loads(response.content)
 
         if result.get('status', 'error') == 'error':
             raise PrometheusError(f'Unable to get metric: {result.get("error", "unknown")}')
 
-        return result['data']['result']
+        return result.get('data', {}).get('result', [])  # Missing keys are treated as an empty result
+
+    def _query_many(self, url: str, params_list: List[Dict[str, str]], timeout: TimeoutType,
+                    max_workers: int) -> List[List[Dict]]:
+        """Perform multiple generic queries concurrently.
+
+        Arguments:
+            url (str): the URL to query.
+            params_list (list): a list of dictionaries of the GET parameters to pass to the URL, one for each query.
+            timeout (:py:data:`wmflib.requests.TimeoutType`): How many seconds to wait for prometheus to reply before
+                giving up. This is passed directly to the requests library.
+            max_workers (int): the maximum number of queries to perform concurrently.
+
+        Returns:
+            list: the list of results of each query, in the same order of the given parameters. See
+            :py:meth:`wmflib.prometheus.PrometheusBase._query` for the format of each one.
+
+        Raises:
+            wmflib.prometheus.PrometheusError: on error of any of the queries.
+
+        """
+        if not params_list:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(params_list)),
+                                thread_name_prefix='wmflib-prometheus') as executor:
+            futures = [executor.submit(self._query, url, params, timeout) for params in params_list]
+            return [future.result() for future in futures]
 
 
 class Prometheus(PrometheusBase):
@@ -64,6 +136,7 @@ class Prometheus(PrometheusBase):
 
     """
 
+    __slots__ = ()
     _prometheus_api: str = 'http://prometheus.svc.{site}.wmnet/{instance}/api/v1/query'
 
     def query(self, query: str, site: str, *, instance: str = 'ops', timeout: TimeoutType = 10.0) -> List[Dict]:
@@ -107,13 +180,38 @@ class Prometheus(PrometheusBase):
             wmflib.prometheus.PrometheusError: on error
 
         """
-        if site not in ALL_DATACENTERS:
-            msg = f'site ({site}) must be one of wmflib.constants.ALL_DATACENTERS {ALL_DATACENTERS}'
-            raise PrometheusError(msg)
+        return self._query(_get_prometheus_url(self._prometheus_api, site, instance), {'query': query}, timeout)
+
+    def query_many(self, queries: Iterable[str], site: str, *, instance: str = 'ops',
+                   timeout: TimeoutType = 10.0, max_workers: int = 8) -> List[List[Dict]]:
+        """Perform multiple generic queries concurrently on the same site and instance.
+
+        Examples:
+            ::
 
-        url = self._prometheus_api.format(site=site, instance=instance)
-        params = {'query': query}
-        return self._query(url, params, timeout)
+                >>> results = prometheus.query_many(['node_memory_MemTotal_bytes{instance=~"host1001:.*"}',
+                ...                                  'node_memory_MemTotal_bytes{instance=~"host1002:.*"}'], 'eqiad')
+
+        Arguments:
+            queries (iterable): the prometheus query strings.
+            site (str): The site to use for queries. Must be one of
+                :py:const:`wmflib.constants.ALL_DATACENTERS`
+            instance (str, optional): The prometheus instance to query on the given site, see
+                https://wikitech.wikimedia.org/wiki/Prometheus#Instances for the full list of available instances.
+            timeout (:py:data:`wmflib.requests.TimeoutType`, optional): How many seconds to wait for prometheus to
+                reply before giving up. This is passed directly to the requests library.
+            max_workers (int, optional): the maximum number of queries to perform concurrently.
+
+        Returns:
+            list: the list of results of each query, in the same order of the given queries. See
+            :py:meth:`wmflib.prometheus.Prometheus.query` for the format of each one.
+
+        Raises:
+            wmflib.prometheus.PrometheusError: on error of any of the queries.
+
+        """
+        url = _get_prometheus_url(self._prometheus_api, site, instance)
+        return self._query_many(url, [{'query': query} for query in queries], timeout, max_workers)
 
 
 class Thanos(PrometheusBase):
@@ -127,7 +225,9 @@ class Thanos(PrometheusBase):
 
     """
 
+    __slots__ = ()
     _thanos_api: str = 'https://thanos-query.discovery.wmnet/api/v1/query'
+    _thanos_params: Dict[str, str] = {'dedup': 'true', 'partial_response': 'false'}  # Sent with all the queries
 
     def query(self, query: str, *, timeout: TimeoutType = 10.0) -> List[Dict]:
         """Perform a generic query.
@@ -173,5 +273,31 @@ class Thanos(PrometheusBase):
             wmflib.prometheus.PrometheusError: on error.
 
         """
-        params = {'dedup': 'true', 'partial_response': 'false', 'query': query}
-        return self._query(self._thanos_api, params, timeout)
+        return self._query(self._thanos_api, {**self._thanos_params, 'query': query}, timeout)
+
+    def query_many(self, queries: Iterable[str], *, timeout: TimeoutType = 10.0,
+                   max_workers: int = 8) -> List[List[Dict]]:
+        """Perform multiple generic queries concurrently.
+
+        Examples:
+            ::
+
+                >>> results = thanos.query_many(['node_memory_MemTotal_bytes{instance=~"host1001:.*"}',
+                ...                              'node_uname_info{instance=~"host1001:.*"}'])
+
+        Arguments:
+            queries (iterable): the prometheus query strings.
+            timeout (:py:data:`wmflib.requests.TimeoutType`, optional): How many seconds to wait for prometheus to
+                reply before giving up. This is passed directly to the requests library.
+            max_workers (int, optional): the maximum number of queries to perform concurrently.
+
+        Returns:
+            list: the list of results of each query, in the same order of the given queries. See
+            :py:meth:`wmflib.prometheus.Thanos.query` for the format of each one.
+
+        Raises:
+            wmflib.prometheus.PrometheusError: on error of any of the queries.
+
+        """
+        params_list = [{**self._thanos_params, 'query': query} for query in queries]
+        return self._query_many(self._thanos_api, params_list, timeout, max_workers)
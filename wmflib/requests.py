@@ -2,7 +2,7 @@
 from typing import Any, Sequence, Tuple, Union
 
 from requests import PreparedRequest, Response, Session
-from requests.adapters import HTTPAdapter
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
 from urllib3.util import Retry
 
 from wmflib import __version__
@@ -18,6 +18,8 @@ DEFAULT_RETRY_STATUS_CODES: Tuple[int, ...] = (429, 500, 502, 503, 504)
 DEFAULT_RETRY_METHODS: Tuple[str, ...] = ('DELETE', 'GET', 'HEAD', 'OPTIONS', 'PUT', 'TRACE')
 """:py:class`tuple`: the default sequence of HTTP methods that are retried if the status code is one of
    :py:const:`DEFAULT_RETRY_STATUS_CODES`."""
+_USER_AGENT_PREFIX = f'pywmflib/{__version__} '
+_USER_AGENT_SUFFIX = ' +https://wikitech.wikimedia.org/wiki/Python/Wmflib'
 
 
 class TimeoutHTTPAdapter(HTTPAdapter):
@@ -62,9 +64,19 @@ class TimeoutHTTPAdapter(HTTPAdapter):
         return super().send(request, **kwargs)
 
 
-def http_session(name: str, *, timeout: TimeoutType = DEFAULT_TIMEOUT, tries: int = 3, backoff: float = 1.0,
-                 retry_codes: Sequence[int] = DEFAULT_RETRY_STATUS_CODES,
-                 retry_methods: Sequence[str] = DEFAULT_RETRY_METHODS) -> Session:
+def http_session(  # pylint: disable=too-many-arguments,useless-suppression
+    name: str,
+    *,
+    timeout: TimeoutType = DEFAULT_TIMEOUT,
+    tries: int = 3,
+    backoff: float = 1.0,
+    retry_codes: Sequence[int] = DEFAULT_RETRY_STATUS_CODES,
+    retry_methods: Sequence[str] = DEFAULT_RETRY_METHODS,
+    pool_connections: int = DEFAULT_POOLSIZE,
+    pool_maxsize: int = DEFAULT_POOLSIZE,
+    pool_block: bool = DEFAULT_POOLBLOCK,
+    backoff_jitter: float = 0.0,
+) -> Session:
     """Return a new requests Session with User-Agent, default timeout and retry logic on failure already setup.
 
     By default the returned session will retry any :py:const:`DEFAULT_RETRY_METHODS` request that returns one of
@@ -98,6 +110,8 @@ def http_session(name: str, *, timeout: TimeoutType = DEFAULT_TIMEOUT, tries: in
             session = http_session('AppName', timeout=(3.0, 10.0), tries=5, backoff=2.0, retry_methods=('GET',))
             # Disable the retry logic, just set the User-Agent and default timeout
             session = http_session('AppName', tries=0)
+            # Keep up to 32 connections open per host, for example when used by a pool of 32 threads
+            session = http_session('AppName', pool_maxsize=32)
 
     See Also:
         https://urllib3.readthedocs.io/en/latest/reference/urllib3.util.html#module-urllib3.util.retry
@@ -122,6 +136,16 @@ def http_session(name: str, *, timeout: TimeoutType = DEFAULT_TIMEOUT, tries: in
             default of :py:const:`DEFAULT_RETRY_STATUS_CODES`.
         retry_methods (sequence): a sequence of strings with the list of HTTP methods to retry intead of the default
             default of :py:const:`DEFAULT_RETRY_METHODS`.
+        pool_connections (int): the number of connection pools to cache, one for each different host. Connections to
+            more hosts than this value are still performed, but the least recently used pools are discarded.
+        pool_maxsize (int): the maximum number of connections to keep open in each pool. When the session is used
+            concurrently by N threads it should be set to at least N, or the exceeding connections are closed after
+            each request, requiring a new handshake for the next one.
+        pool_block (bool): whether to block waiting for a free connection when all the ``pool_maxsize`` connections of
+            a pool are in use, instead of opening a new connection that is not kept afterwards.
+        backoff_jitter (float): the maximum random amount of seconds to add to each sleep between retries, to avoid
+            that multiple clients failing at the same time retry all together. Ignored with urllib3 versions older
+            than v2.0.0 that don't support it.
 
     Returns:
         requests.Session: the pre-configured session.
@@ -130,8 +154,7 @@ def http_session(name: str, *, timeout: TimeoutType = DEFAULT_TIMEOUT, tries: in
     # The method_whitelist parameter has been deprecated since urllib3 v1.26.0 and will be removed in v2.0.
     # It has been renamed to allowed_methods in v1.26.0. Keep backward compatibility.
     session = Session()
-    user_agent = f'pywmflib/{__version__} {name} +https://wikitech.wikimedia.org/wiki/Python/Wmflib'
-    session.headers.update({'User-Agent': user_agent})
+    session.headers['User-Agent'] = _USER_AGENT_PREFIX + name + _USER_AGENT_SUFFIX
 
     if tries > 0:
         methods_param_name = 'allowed_methods' if hasattr(Retry.DEFAULT, 'allowed_methods') else 'method_whitelist'
@@ -142,10 +165,14 @@ def http_session(name: str, *, timeout: TimeoutType = DEFAULT_TIMEOUT, tries: in
             'status_forcelist': retry_codes,
             methods_param_name: retry_methods,
         }
+        if backoff_jitter and hasattr(Retry.DEFAULT, 'backoff_jitter'):  # Added in urllib3 v2.0.0
+            params['backoff_jitter'] = backoff_jitter
         retry_strategy = Retry(**params)  # type: ignore[arg-type]
-        adapter = TimeoutHTTPAdapter(timeout=timeout, max_retries=retry_strategy)
+        adapter = TimeoutHTTPAdapter(timeout=timeout, max_retries=retry_strategy, pool_connections=pool_connections,
+                                     pool_maxsize=pool_maxsize, pool_block=pool_block)
     else:
-        adapter = TimeoutHTTPAdapter(timeout=timeout)
+        adapter = TimeoutHTTPAdapter(timeout=timeout, pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                                     pool_block=pool_block)
 
     session.mount('http://', adapter)
     session.mount('https://', adapter)
@@ -6,9 +6,7 @@ from pathlib import Path
 
 import pytest
 
-from pkg_resources import parse_version
-
-CAPLOG_MIN_VERSION = '3.3.0'
+CAPLOG_MIN_VERSION = (3, 3)
 TESTS_BASE_PATH = Path(__file__).parent.resolve()
 
 
@@ -26,14 +24,11 @@ def get_fixture_path(*paths):
 
 
 require_caplog = pytest.mark.skipif(
-    parse_version(pytest.__version__) < parse_version(CAPLOG_MIN_VERSION), reason='Requires caplog fixture')
+    tuple(int(i) for i in pytest.__version__.split('.')[:2]) < CAPLOG_MIN_VERSION, reason='Requires caplog fixture')
 
 
 def check_logs(logs, message, level):
     """Assert that a log record with the given message and level is present."""
-    for record in logs.records:
-        if message in record.getMessage():
-            assert record.levelno == level
-            break
-    else:
+    # Check the level first to format the message only of the records with the given level
+    if not any(record.levelno == level and message in record.getMessage() for record in logs.records):
         raise RuntimeError(f"{logging.getLevelName(level)} log record with message '{message}' not found")
@@ -2,6 +2,9 @@
 import logging
 
 from textwrap import dedent
+from unittest import mock
+
+import pytest
 
 from wmflib import actions
 from wmflib.tests import check_logs, require_caplog
@@ -22,6 +25,11 @@ def test_actionsdict_string_representation():
     assert dedent(expected).lstrip() == str(actions_dict)
 
 
+def test_actionsdict_string_representation_empty():
+    """It should convert an empty instance to an empty string."""
+    assert str(actions.ActionsDict()) == ''
+
+
 class TestActions:
     """Test class for the Actions class."""
 
@@ -78,6 +86,55 @@ class TestActions:
         assert self.actions.has_failures
         assert len(self.actions.actions) == 3
 
+    @pytest.mark.parametrize('methods, expected', (
+        (('success',), 'PASS'),
+        (('success', 'warning'), 'WARN'),
+        (('warning', 'success'), 'WARN'),
+        (('warning', 'failure'), 'FAIL'),
+        (('failure', 'warning', 'success'), 'FAIL'),
+    ))
+    def test_status_worst_result(self, methods, expected):
+        """The status should be determined by the most severe result registered, independently of the order."""
+        for method in methods:
+            getattr(self.actions, method)('message')
+
+        assert self.actions.status == expected
+        assert self.actions.has_warnings is ('warning' in methods)
+        assert self.actions.has_failures is ('failure' in methods)
+
+    @pytest.mark.parametrize('attribute', ('has_warnings', 'has_failures'))
+    def test_status_properties_read_only(self, attribute):
+        """The has_warnings and has_failures properties should be derived from the actions and not be settable."""
+        with pytest.raises(AttributeError):
+            setattr(self.actions, attribute, True)
+
+    def test_slots(self):
+        """It should not allow to set arbitrary attributes, as it defines __slots__."""
+        assert not hasattr(self.actions, '__dict__')
+        with pytest.raises(AttributeError):
+            self.actions.invalid = True  # pylint: disable=attribute-defined-outside-init
+
+    @mock.patch('wmflib.actions.logger')
+    def test_disabled_level_not_logged(self, mocked_logger):
+        """It should not call the logger for the actions with a disabled level, but still register them."""
+        mocked_logger.isEnabledFor.side_effect = lambda level: level >= logging.WARNING
+        self.actions.success('success1')
+        self.actions.warning('warning1')
+        mocked_logger.log.assert_called_once_with(logging.WARNING, 'warning1')
+        assert self.actions.actions == ['success1', 'warning1']
+
+    def test_string_representation_after_each_action(self):
+        """The string representation should be up to date after each action while the actions stay unformatted."""
+        self.actions.success('success1')
+        assert str(self.actions) == 'name1 (**PASS**)\n  - success1'
+        self.actions.failure('failure1')
+        assert str(self.actions) == 'name1 (**FAIL**)\n  - success1\n  - failure1'
+        assert self.actions.actions == ['success1', 'failure1']
+
+    def test_string_representation_no_actions(self):
+        """It should convert an instance without actions to a string with just the name and status."""
+        assert str(self.actions) == 'name1 (**PASS**)\n'
+
     def test_string_representation(self):
         """It should convert the instance to a nice string representation."""
         self.actions.success('success1')
@@ -90,3 +147,27 @@ class TestActions:
           - failure1
         """
         assert dedent(expected).strip() == str(self.actions)
+
+    @require_caplog
+    def test_context_manager(self, caplog):
+        """When used as a context manager it should log all the actions once when exiting the context."""
+        with self.actions as actions:
+            actions.success('success1')
+            actions.warning('warning1')
+            assert not caplog.records
+
+        assert actions.status == 'WARN'
+        assert len(actions.actions) == 2
+        assert len(caplog.records) == 1
+        check_logs(caplog, 'Actions on name1:\n  - success1\n  - warning1', logging.WARNING)
+
+        actions.failure('failure1')  # Outside of the context it should log directly
+        check_logs(caplog, 'failure1', logging.ERROR)
+
+    @require_caplog
+    def test_context_manager_no_actions(self, caplog):
+        """When used as a context manager without registering any action it should not log anything."""
+        with self.actions:
+            pass
+
+        assert not caplog.records
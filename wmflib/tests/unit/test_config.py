@@ -3,10 +3,11 @@
 import configparser
 
 from logging import DEBUG
+from unittest import mock
 
 import pytest
 
-from wmflib.config import load_ini_config, load_yaml_config
+from wmflib.config import clear_config_cache, load_ini_config, load_yaml_config
 from wmflib.exceptions import WmflibError
 from wmflib.tests import check_logs, get_fixture_path, require_caplog
 
@@ -52,18 +53,52 @@ def test_load_ini_config():
     assert config.defaults()['key'] == 'value'
 
 
-@pytest.mark.parametrize('message', 'File contains no section headers')
-def test_load_invalid_ini_config(message):
-    """Loading an invalid INI config should raise an exception."""
+@pytest.mark.parametrize('name, message', (
+    ('invalid.ini', 'File contains no section headers'),
+    ('non-existent.ini', 'FileNotFoundError'),
+))
+def test_load_invalid_ini_config(name, message):
+    """Loading an invalid or non-existent INI config should raise an exception."""
     with pytest.raises(WmflibError, match=message):
-        load_ini_config(get_fixture_path('config', 'invalid.ini'))
+        load_ini_config(get_fixture_path('config', name))
 
 
 @require_caplog
-def test_load_invalid_ini_config_no_raise(caplog):
-    """Loading an invalid config with raises=False should return an empty ConfigParser."""
+@pytest.mark.parametrize('name', ('invalid.ini', 'non-existent.ini'))
+def test_load_invalid_ini_config_no_raise(caplog, name):
+    """Loading an invalid or non-existent config with raises=False should return an empty ConfigParser."""
     with caplog.at_level(DEBUG):
-        config = load_ini_config(get_fixture_path('config', 'invalid.ini'), raises=False)
+        config = load_ini_config(get_fixture_path('config', name), raises=False)
 
     assert configparser.ConfigParser() == config
     check_logs(caplog, 'Could not load config file', DEBUG)
+
+
+def test_load_yaml_config_cached(tmp_path):
+    """Loading the same YAML config should return a copy of the cached one until the file is modified."""
+    config_file = tmp_path / 'config.yaml'
+    config_file.write_text('key: value\n')
+    config = load_yaml_config(config_file)
+    config['key'] = 'modified'
+    assert load_yaml_config(config_file) == {'key': 'value'}
+
+    with mock.patch('wmflib.config.yaml.load') as mocked_load:
+        assert load_yaml_config(config_file) == {'key': 'value'}
+        assert not mocked_load.called
+
+    config_file.write_text('key: new_value\n')
+    assert load_yaml_config(config_file) == {'key': 'new_value'}
+
+
+@mock.patch('wmflib.config.yaml.load', return_value={'key': 'value'})
+def test_clear_config_cache(mocked_load):
+    """After clearing the cache the config files should be parsed again."""
+    config_file = get_fixture_path('config', 'valid.yaml')
+    clear_config_cache()
+    load_yaml_config(config_file)
+    load_yaml_config(config_file)
+    assert mocked_load.call_count == 1
+    clear_config_cache()
+    load_yaml_config(config_file)
+    assert mocked_load.call_count == 2
+    clear_config_cache()
@@ -1,6 +1,13 @@
 """Constants module tests."""
 
-from wmflib.constants import ALL_DATACENTERS, CORE_DATACENTERS, DATACENTER_NUMBERING_PREFIX, US_DATACENTERS
+from wmflib.constants import (
+    ALL_DATACENTERS,
+    ALL_DATACENTERS_SET,
+    CORE_DATACENTERS,
+    CORE_DATACENTERS_SET,
+    DATACENTER_NUMBERING_PREFIX,
+    US_DATACENTERS,
+)
 
 
 def test_datacenters():
@@ -16,3 +23,9 @@ def test_core_datacenters():
 def test_us_datacenters():
     """Verify that the US datacenters are a subset of all datacenters."""
     assert set(US_DATACENTERS).issubset(set(ALL_DATACENTERS))
+
+
+def test_datacenters_sets():
+    """Verify that the datacenters sets are in sync with the respective tuples."""
+    assert ALL_DATACENTERS_SET == set(ALL_DATACENTERS)
+    assert CORE_DATACENTERS_SET == set(CORE_DATACENTERS)
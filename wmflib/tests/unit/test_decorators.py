@@ -1,4 +1,8 @@
 """Dnsdisc module tests."""
+import asyncio
+import logging
+import sys
+
 from datetime import timedelta
 from unittest import mock
 
@@ -33,6 +37,9 @@ class TestRetryParams:
          'Delay must be greater than 1 if backoff_mode is exponential'),
         ({'tries': 0}, 'Tries must be a positive integer, got 0'),
         ({'failure_message': ''}, 'A failure_message must be set.'),
+        ({'max_delay': timedelta(seconds=0)}, 'Max delay must be positive, got 0:00:00'),
+        ({'jitter': -0.1}, 'Jitter must be between 0 and 1, got -0.1'),
+        ({'jitter': 1.5}, 'Jitter must be between 0 and 1, got 1.5'),
     ))
     def test_validate_invalid_params(self, modified, expected):
         """It should raise WmflibError if the parameters are invalid."""
@@ -40,6 +47,14 @@ class TestRetryParams:
         with pytest.raises(WmflibError, match=expected):
             params.validate()
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason='Slots dataclasses are supported only on Python 3.10+')
+    def test_slots(self):
+        """It should not have an instance dictionary and should not allow to set unknown attributes."""
+        params = RetryParams(**self.base_params)
+        assert not hasattr(params, '__dict__')
+        with pytest.raises(AttributeError):
+            params.invalid = True  # pylint: disable=attribute-defined-outside-init
+
 
 def _generate_mocked_function(calls):
     func = mock.Mock()
@@ -146,6 +161,50 @@ def test_retry_fail_chained_exceptions(mocked_sleep, caplog):
     assert mocked_sleep.call_count == 2
 
 
+@mock.patch('wmflib.decorators._exception_message')
+@mock.patch('wmflib.decorators.time.sleep', return_value=None)
+def test_retry_warning_disabled(mocked_sleep, mocked_exception_message, caplog):
+    """When the warning level is disabled for the logger, @retry should not compute the exception message."""
+    func = _generate_mocked_function([WmflibError('error1'), True])
+    with caplog.at_level(logging.ERROR, logger='wmflib.decorators'):
+        assert retry(func)()
+
+    assert not mocked_exception_message.called
+    assert 'error1' not in caplog.text
+    assert mocked_sleep.call_count == 1
+
+
+@mock.patch('wmflib.decorators.time.sleep', return_value=None)
+def test_retry_cyclic_chained_exceptions(mocked_sleep, caplog):
+    """When @retry catches an exception with a cyclic chain, it should log each exception message only once."""
+    error1 = WmflibError('error1')
+    error2 = WmflibError('error2')
+    error1.__cause__ = error2
+    error2.__cause__ = error1
+    func = _generate_mocked_function([error1, True])
+    assert retry(func)()
+    assert 'error1\nCaused by: error2\n' in caplog.text
+    assert caplog.text.count('Caused by') == 1
+    assert mocked_sleep.call_count == 1
+
+
+@mock.patch('wmflib.decorators.time.sleep', return_value=None)
+def test_retry_long_chained_exceptions(mocked_sleep, caplog):
+    """When @retry catches an exception with a very long chain, it should log only the most recent exceptions."""
+    error = WmflibError('error0')
+    for i in range(1, 100):
+        chained = WmflibError(f'error{i}')
+        chained.__context__ = error
+        error = chained
+
+    func = _generate_mocked_function([error, True])
+    assert retry(func)()
+    assert caplog.text.count('Raised while handling') == 31
+    assert 'error99\n' in caplog.text
+    assert 'error67\n' not in caplog.text
+    assert mocked_sleep.call_count == 1
+
+
 @mock.patch('wmflib.decorators.time.sleep', return_value=None)
 def test_retry_dynamic_params_callback(mocked_sleep):
     """It should execute the given callback and use the new parameters."""
@@ -160,6 +219,102 @@ def test_retry_dynamic_params_callback(mocked_sleep):
     assert mocked_sleep.call_count == 1
 
 
+@mock.patch('wmflib.decorators.time.sleep', return_value=None)
+def test_retry_dynamic_params_callback_isolated(mocked_sleep):
+    """The changes made by the callbacks should not leak into the parameters of the subsequent calls."""
+    def callback(params, _func, args, _kwargs):
+        """Alter the tries value only if requested."""
+        if args[0]:
+            params.tries = 1
+
+    func = _generate_mocked_function([WmflibError('error1'), WmflibError('error2'), True])
+    decorated = retry(tries=2, dynamic_params_callbacks=(callback,))(func)
+
+    with pytest.raises(WmflibError, match='error1'):
+        decorated(True)
+
+    assert decorated(False)
+    assert mocked_sleep.call_count == 1
+
+
+def test_retry_invalid_params():
+    """Using @retry with invalid parameters and without dynamic callbacks should raise only when called."""
+    func = _generate_mocked_function([True, True])
+    decorated = retry(tries=0)(func)  # pylint: disable=no-value-for-parameter
+    for _ in range(2):  # The invalid parameters are not cached
+        with pytest.raises(WmflibError, match='Tries must be a positive integer, got 0'):
+            decorated()
+
+    assert not func.called
+
+
+@mock.patch('wmflib.decorators.time.sleep', return_value=None)
+def test_retry_max_delay(mocked_sleep):
+    """Using @retry with max_delay should cap the delay between attempts."""
+    func = _generate_mocked_function([WmflibError('error1'), WmflibError('error2'), WmflibError('error3'), True])
+    ret = retry(tries=4, max_delay=timedelta(seconds=10))(func)()  # pylint: disable=no-value-for-parameter
+
+    assert ret
+    mocked_sleep.assert_has_calls([mock.call(3.0), mock.call(9.0), mock.call(10.0)])
+
+
+@pytest.mark.parametrize('dynamic', (False, True))
+@mock.patch('wmflib.decorators.time.sleep', return_value=None)
+def test_retry_max_delay_many_tries(mocked_sleep, dynamic):
+    """Using @retry with max_delay should allow a large number of tries without overflowing the backoff."""
+    side_effects = [WmflibError(f'error{i}') for i in range(1199)] + [True]
+    func = _generate_mocked_function(side_effects)
+    callbacks = (lambda *_: None,) if dynamic else ()
+    ret = retry(  # pylint: disable=no-value-for-parameter
+        tries=1200, max_delay=timedelta(seconds=60), dynamic_params_callbacks=callbacks)(func)()
+
+    assert ret
+    sleeps = [call.args[0] for call in mocked_sleep.call_args_list]
+    assert sleeps[:4] == [3.0, 9.0, 27.0, 60.0]
+    assert sleeps[4:] == [60.0] * 1195
+
+
+@mock.patch('wmflib.decorators.random.uniform', return_value=1.1)
+@mock.patch('wmflib.decorators.time.sleep', return_value=None)
+def test_retry_jitter(mocked_sleep, mocked_uniform):
+    """Using @retry with jitter should randomize the delay between attempts."""
+    func = _generate_mocked_function([WmflibError('error1'), WmflibError('error2'), True])
+    ret = retry(jitter=0.2)(func)()  # pylint: disable=no-value-for-parameter
+
+    assert ret
+    mocked_uniform.assert_called_with(0.8, 1.2)
+    assert [call.args[0] for call in mocked_sleep.call_args_list] == pytest.approx([3.3, 9.9])
+
+
+@pytest.mark.parametrize('dynamic', (False, True))
+def test_retry_coroutine_function(dynamic):
+    """Using @retry on a coroutine function should await it and asyncio.sleep() between the attempts."""
+    side_effects = [WmflibError('error1'), WmflibError('error2'), True]
+    sleeps = []
+
+    async def func():
+        """Coroutine function that follows the side effects."""
+        effect = side_effects.pop(0)
+        if isinstance(effect, Exception):
+            raise effect
+        return effect
+
+    async def mocked_asyncio_sleep(delay):
+        """Record the asyncio.sleep() calls."""
+        sleeps.append(delay)
+
+    callbacks = [lambda *_: None] if dynamic else []
+    decorated = retry(delay=timedelta(seconds=1), backoff_mode='linear', dynamic_params_callbacks=callbacks)(func)
+    with mock.patch('wmflib.decorators.asyncio.sleep', mocked_asyncio_sleep):
+        with mock.patch('wmflib.decorators.time.sleep') as mocked_sleep:
+            ret = asyncio.run(decorated())
+
+    assert ret
+    assert sleeps == [1, 2]
+    assert not mocked_sleep.called
+    assert asyncio.iscoroutinefunction(decorated)
+
+
 @pytest.mark.parametrize('mode, base, values', (
     ('constant', 0, (0,) * 5),
     ('constant', 0.5, (0.5,) * 5),
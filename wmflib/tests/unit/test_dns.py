@@ -5,8 +5,9 @@ from unittest import mock
 import dns
 import pytest
 
+from wmflib import dns as dns_module
 from wmflib.constants import PUBLIC_AUTHDNS
-from wmflib.dns import Dns, DnsError, DnsNotFound, PublicAuthDns
+from wmflib.dns import Dns, DnsError, DnsNotFound, NEGATIVE_CACHE_TTL, PublicAuthDns
 
 
 # TODO: convert the mocked objects using dnspython objects. It requires quite some code given the structure of
@@ -16,45 +17,39 @@ MockedDnsTarget = namedtuple('MockedDnsTarget', ['target'])
 MockedDnsAnswer = namedtuple('MockedDnsAnswer', ['ttl', 'rrset'])
 
 
-class MockedTarget:
-    """Represent a DNS PTR response target."""
-
-    def __init__(self, target):
-        """Constructor."""
-        self.target = target
-
-    def to_text(self):
-        """Required to mock the dnspython object."""
-        return self.target
-
-
 MOCKED_RESPONSES = {
     # (qname, record_type): MockedDnsAnswer(),
     ('host1.example.com', 'A'): MockedDnsAnswer(ttl=600, rrset=[MockedDnsAddress(address='10.0.0.1')]),
     ('host1.example.com', 'AAAA'): MockedDnsAnswer(ttl=600, rrset=[MockedDnsAddress(address='2001::1')]),
-    ('10.0.0.1', 'PTR'): MockedDnsAnswer(ttl=600, rrset=[MockedDnsTarget(target=MockedTarget('host1.example.com.'))]),
-    ('2001::1', 'PTR'): MockedDnsAnswer(ttl=600, rrset=[MockedDnsTarget(target=MockedTarget('host1.example.com.'))]),
+    ('10.0.0.1', 'PTR'): MockedDnsAnswer(
+        ttl=600, rrset=[MockedDnsTarget(target=dns.name.from_text('host1.example.com.'))]),
+    ('2001::1', 'PTR'): MockedDnsAnswer(
+        ttl=600, rrset=[MockedDnsTarget(target=dns.name.from_text('host1.example.com.'))]),
     ('host2.example.com', 'A'): MockedDnsAnswer(ttl=600, rrset=[MockedDnsAddress(address='10.0.0.1')]),
     ('host2.example.com', 'AAAA'): dns.resolver.NoAnswer('Not found'),
+    ('host4.example.com', 'A'): MockedDnsAnswer(ttl=600, rrset=[MockedDnsAddress(address='10.0.0.4')]),
+    ('host4.example.com', 'AAAA'): dns.exception.DNSException('Not defined'),
     ('host3.example.com', 'A'):
         MockedDnsAnswer(ttl=600, rrset=[MockedDnsAddress(address='10.0.0.1'), MockedDnsAddress(address='10.0.0.2')]),
     ('host3.example.com', 'AAAA'):
         MockedDnsAnswer(ttl=600, rrset=[MockedDnsAddress(address='2001::1'), MockedDnsAddress(address='2001::2')]),
     ('2001::2', 'PTR'):
         MockedDnsAnswer(ttl=600, rrset=[
-            MockedDnsTarget(target=MockedTarget('host3.example.com.')),
-            MockedDnsTarget(target=MockedTarget('service.example.com.'))]),
+            MockedDnsTarget(target=dns.name.from_text('host3.example.com.')),
+            MockedDnsTarget(target=dns.name.from_text('service.example.com.'))]),
     ('service.example.com', 'CNAME'): MockedDnsAnswer(
-        ttl=600, rrset=[MockedDnsTarget(target=MockedTarget('host1.example.com.'))]),
+        ttl=600, rrset=[MockedDnsTarget(target=dns.name.from_text('host1.example.com.'))]),
     ('multiservice.example.com', 'CNAME'): MockedDnsAnswer(
-        ttl=600, rrset=[MockedDnsTarget(target=MockedTarget('host1.example.com.')),
-                        MockedDnsTarget(target=MockedTarget('host2.example.com.'))]),
-    ('relative.example.com', 'CNAME'): MockedDnsAnswer(ttl=600, rrset=[MockedDnsTarget(target=MockedTarget('host1'))]),
+        ttl=600, rrset=[MockedDnsTarget(target=dns.name.from_text('host1.example.com.')),
+                        MockedDnsTarget(target=dns.name.from_text('host2.example.com.'))]),
+    ('relative.example.com', 'CNAME'): MockedDnsAnswer(
+        ttl=600, rrset=[MockedDnsTarget(target=dns.name.from_text('host1', origin=None))]),
 }
 
 
-def mocked_dns_query(qname, record_type):
+def mocked_dns_query(qname, record_type, search=False):
     """Mock a dnspython query response."""
+    assert search
     if record_type == 'PTR':
         qname = dns.reversename.to_address(qname)
         if isinstance(qname, bytes):
@@ -75,6 +70,13 @@ def mocked_dns_query(qname, record_type):
     return response
 
 
+@pytest.fixture(autouse=True)
+def clear_default_resolver():
+    """Clear the cached resolvers, as the tests mock the resolver class."""
+    yield
+    dns_module._get_resolver.cache_clear()  # pylint: disable=protected-access
+
+
 class TestDns:
     """Dns class tests."""
 
@@ -83,13 +85,21 @@ class TestDns:
         """Initialize the test environment for Dns."""
         # pylint: disable=attribute-defined-outside-init
         self.mocked_resolver = mocked_resolver
-        self.mocked_resolver.return_value.query = mocked_dns_query
+        self.mocked_resolver.return_value.resolve = mocked_dns_query
         self.dns = Dns()
 
     def test_init(self):
         """The dns.resolver.Resolver should have been called without parameters."""
         self.mocked_resolver.assert_called_once_with()
 
+    @mock.patch('wmflib.dns.resolver.Resolver')
+    def test_init_default_resolver_cached(self, mocked_resolver):
+        """The default resolver should be created only once and shared between instances."""
+        dns1 = Dns()
+        dns2 = Dns()
+        assert dns1._resolver is dns2._resolver is self.mocked_resolver.return_value  # pylint: disable=protected-access
+        assert not mocked_resolver.called
+
     @mock.patch('wmflib.dns.resolver.Resolver')
     def test_init_with_nameserver(self, mocked_resolver):
         """When passing a nameserver address, this should be set in the dns Resolver too."""
@@ -131,6 +141,32 @@ class TestDns:
         with pytest.raises(DnsNotFound, match='Record A or AAAA not found for missing.example.com'):
             self.dns.resolve_ips('missing.example.com')
 
+    def test_resolve_ips_raise(self):
+        """Should raise DnsError if any of the A or AAAA lookups fails with a generic error."""
+        with pytest.raises(DnsError, match='Unable to resolve AAAA record for host4.example.com'):
+            self.dns.resolve_ips('host4.example.com')
+
+        with pytest.raises(DnsError, match='Unable to resolve A record for raise.example.com'):
+            self.dns.resolve_ips('raise.example.com')
+
+    def test_bulk_resolve_ips_ok(self):
+        """Should return the IPv4 and IPv6 addresses of all the names, an empty list for the missing ones."""
+        names = ['host1.example.com', 'host2.example.com', 'missing.example.com', 'host1.example.com']
+        assert self.dns.bulk_resolve_ips(names) == {
+            'host1.example.com': ['10.0.0.1', '2001::1'],
+            'host2.example.com': ['10.0.0.1'],
+            'missing.example.com': [],
+        }
+
+    def test_bulk_resolve_ips_empty(self):
+        """Should return an empty dictionary if no name is given."""
+        assert self.dns.bulk_resolve_ips([]) == {}
+
+    def test_bulk_resolve_ips_raise(self):
+        """Should raise DnsError if any of the lookups fails with a generic error."""
+        with pytest.raises(DnsError, match='Unable to resolve AAAA record for host4.example.com'):
+            self.dns.bulk_resolve_ips(['host1.example.com', 'host4.example.com'])
+
     @pytest.mark.parametrize('address, response', (
         ('10.0.0.1', ['host1.example.com']),
         ('2001::1', ['host1.example.com']),
@@ -171,9 +207,80 @@ class TestDns:
             self.dns.resolve(qname, record_type)
 
 
+class TestDnsCache:
+    """Dns class tests with the cache enabled."""
+
+    @mock.patch('wmflib.dns.resolver.Resolver')
+    def setup_method(self, _, mocked_resolver):
+        """Initialize the test environment for Dns."""
+        # pylint: disable=attribute-defined-outside-init
+        self.mocked_query = mocked_resolver.return_value.resolve
+        self.mocked_query.side_effect = mocked_dns_query
+        self.dns = Dns(cache_max_ttl=60)
+
+    def test_resolve_cached(self):
+        """Should query the DNS only once for the same qname and record type while the cache is valid."""
+        assert self.dns.resolve_ipv4('host1.example.com') == ['10.0.0.1']
+        assert self.dns.resolve_ipv4('host1.example.com') == ['10.0.0.1']
+        assert self.dns.resolve_ipv6('host1.example.com') == ['2001::1']
+        assert self.mocked_query.call_count == 2
+
+    @mock.patch('wmflib.dns.time.monotonic')
+    def test_resolve_cache_expired(self, mocked_monotonic):
+        """Should query the DNS again once the capped TTL of the cached response is expired."""
+        mocked_monotonic.return_value = 1000
+        self.dns.resolve_ipv4('host1.example.com')
+        mocked_monotonic.return_value = 1059
+        self.dns.resolve_ipv4('host1.example.com')
+        assert self.mocked_query.call_count == 1
+        mocked_monotonic.return_value = 1060
+        self.dns.resolve_ipv4('host1.example.com')
+        assert self.mocked_query.call_count == 2
+
+    @mock.patch('wmflib.dns.time.monotonic')
+    def test_resolve_not_found_cached(self, mocked_monotonic):
+        """Should cache the not found responses for a shorter time."""
+        mocked_monotonic.return_value = 1000
+        for _ in range(2):
+            with pytest.raises(DnsNotFound, match='Record AAAA not found for host2.example.com'):
+                self.dns.resolve('host2.example.com', 'AAAA')
+
+        assert self.mocked_query.call_count == 1
+        mocked_monotonic.return_value = 1000 + NEGATIVE_CACHE_TTL
+        with pytest.raises(DnsNotFound, match='Record AAAA not found for host2.example.com'):
+            self.dns.resolve('host2.example.com', 'AAAA')
+
+        assert self.mocked_query.call_count == 2
+
+    def test_resolve_errors_not_cached(self):
+        """Should not cache generic DNS errors."""
+        for _ in range(2):
+            with pytest.raises(DnsError, match='Unable to resolve A record for raise.example.com'):
+                self.dns.resolve('raise.example.com', 'A')
+
+        assert self.mocked_query.call_count == 2
+
+    @mock.patch('wmflib.dns.CACHE_MAX_SIZE', 1)
+    def test_resolve_cache_max_size(self):
+        """Should evict the least recently used responses when the cache is full."""
+        self.dns.resolve_ipv4('host1.example.com')
+        self.dns.resolve_ipv4('host3.example.com')
+        self.dns.resolve_ipv4('host1.example.com')
+        assert self.mocked_query.call_count == 3
+
+
 @mock.patch('wmflib.dns.resolver.Resolver')
 def test_public_auth_dns_init(mocked_resolver):
     """The Production nameservers should be set on the resolver."""
     PublicAuthDns()
     mocked_resolver.assert_called_once_with(configure=False)
     assert mocked_resolver.return_value.nameservers == list(PUBLIC_AUTHDNS)
+
+
+@mock.patch('wmflib.dns.resolver.Resolver')
+def test_public_auth_dns_shared_resolver(mocked_resolver):
+    """The resolver should be created only once and shared between the instances."""
+    dns1 = PublicAuthDns()
+    dns2 = PublicAuthDns()
+    mocked_resolver.assert_called_once_with(configure=False)
+    assert dns1._resolver is dns2._resolver  # pylint: disable=protected-access
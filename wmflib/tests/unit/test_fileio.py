@@ -1,5 +1,8 @@
 """File I/O module tests."""
 import fcntl
+import os
+import signal
+import threading
 
 from unittest import mock
 
@@ -19,7 +22,7 @@ def try_lock_file(test_file):
             return False
 
 
-@mock.patch('wmflib.decorators.time.sleep', return_value=None)
+@mock.patch('wmflib.fileio.time.sleep', return_value=None)
 def test_locked_open_success(mocked_sleep, tmp_path):
     """It should acquire an exclusive lock to a file and write to it."""
     test_file = tmp_path / 'acquire_lock'
@@ -32,11 +35,118 @@ def test_locked_open_success(mocked_sleep, tmp_path):
     mocked_sleep.assert_not_called()
 
 
-@mock.patch('wmflib.decorators.time.sleep', return_value=None)
-def test_locked_open_fail(mocked_sleep, locked_file):
-    """It should retry to get an exclusive lock and raise a LockError exception on failure."""
+@mock.patch('wmflib.fileio.signal.signal')
+@mock.patch('wmflib.fileio.random.uniform', return_value=1.0)
+@mock.patch('wmflib.fileio.time')
+def test_locked_open_backoff_fail(mocked_time, _mocked_uniform, mocked_signal, locked_file):
+    """It should retry with an exponential backoff to get an exclusive lock and raise a LockError on failure."""
+    mocked_time.monotonic.side_effect = [0, 0.5, 1, 1.5, 2, 2.5, 3, 3.5, 4, 4.5, 5, 5.5, 6, 9.9, 10]
     with pytest.raises(LockError, match='Unable to acquire exclusive lock on'):
         with locked_open(locked_file):
             assert False, 'Execution should not reach this point'
 
-    mocked_sleep.assert_has_calls([mock.call(1.0)] * 9)  # 10 tries, 9 sleeps
+    expected = [0.005, 0.01, 0.02, 0.04, 0.08, 0.16, 0.32, 0.5, 0.5, 0.5, 0.5, 0.5, 0.1]
+    assert [call.args[0] for call in mocked_time.sleep.call_args_list] == pytest.approx(expected)
+    mocked_signal.assert_not_called()  # The alarm is used only if explicitly requested
+
+
+@mock.patch('wmflib.fileio.time.sleep', return_value=None)
+def test_locked_open_backoff_success(mocked_sleep, locked_file):
+    """It should retry to get an exclusive lock until it succeeds."""
+    side_effect = [BlockingIOError, BlockingIOError, BlockingIOError, None, None]
+    with mock.patch('wmflib.fileio.fcntl.flock', side_effect=side_effect):
+        with locked_open(locked_file):
+            pass
+
+    assert mocked_sleep.call_count == 2
+
+
+def test_locked_open_alarm_fail(locked_file):
+    """It should wait for the lock with a blocking call and raise a LockError on timeout."""
+    with pytest.raises(LockError, match='Unable to acquire exclusive lock on .* within 0.1 seconds'):
+        with locked_open(locked_file, timeout=0.1, use_alarm=True):
+            assert False, 'Execution should not reach this point'
+
+    assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+    assert signal.getsignal(signal.SIGALRM) is signal.SIG_DFL
+
+
+def test_locked_open_alarm_success(tmp_path):
+    """It should wait for the lock with a blocking call and acquire it as soon as it's released."""
+    test_file = tmp_path / 'acquire_lock'
+    test_file.write_text('')
+    with open(test_file, encoding='utf-8') as fd:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        timer = threading.Timer(0.1, fcntl.flock, args=(fd, fcntl.LOCK_UN))
+        timer.start()
+        with locked_open(test_file, timeout=5, use_alarm=True):
+            assert not try_lock_file(test_file)
+
+        timer.join()
+
+    assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+
+
+def test_locked_open_alarm_after_lock(tmp_path):
+    """It should keep the lock and restore the previous handler if the alarm fires right after acquiring the lock."""
+    test_file = tmp_path / 'acquire_lock'
+    test_file.write_text('')
+
+    def disarm(which, seconds):
+        """Deliver the alarm just before disarming the timer, after the lock was acquired."""
+        if not seconds:
+            os.kill(os.getpid(), signal.SIGALRM)
+        return (0.0, 0.0)
+
+    with mock.patch('wmflib.fileio.fcntl.flock', side_effect=[BlockingIOError, None, None]):
+        with mock.patch('wmflib.fileio.signal.setitimer', side_effect=disarm) as mocked_setitimer:
+            with locked_open(test_file, timeout=5, use_alarm=True):
+                pass
+
+    assert mocked_setitimer.call_args_list == [mock.call(signal.ITIMER_REAL, 5), mock.call(signal.ITIMER_REAL, 0)]
+    assert signal.getsignal(signal.SIGALRM) is signal.SIG_DFL
+
+
+@pytest.mark.parametrize('recheck, raises', (
+    (None, False),
+    (BlockingIOError, True),
+))
+def test_locked_open_alarm_race(recheck, raises, tmp_path):
+    """If the alarm interrupts the blocking call it should still check if the lock was acquired right before."""
+    test_file = tmp_path / 'acquire_lock'
+    test_file.write_text('')
+    timeout_error = LockError(f'Unable to acquire exclusive lock on {test_file} within 5 seconds')
+    with mock.patch('wmflib.fileio.fcntl.flock', side_effect=[BlockingIOError, timeout_error, recheck, None]):
+        if raises:
+            with pytest.raises(LockError, match='within 5 seconds'):
+                with locked_open(test_file, timeout=5, use_alarm=True):
+                    assert False, 'Execution should not reach this point'
+        else:
+            with locked_open(test_file, timeout=5, use_alarm=True):
+                pass
+
+    assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+    assert signal.getsignal(signal.SIGALRM) is signal.SIG_DFL
+
+
+@mock.patch('wmflib.fileio.time.sleep', return_value=None)
+def test_locked_open_alarm_fallback(mocked_sleep, locked_file):
+    """It should fall back to the backoff if requested to use the alarm when a timer is already set by the caller."""
+    signal.setitimer(signal.ITIMER_REAL, 60)
+    try:
+        with mock.patch('wmflib.fileio.fcntl.flock', side_effect=[BlockingIOError, BlockingIOError, None, None]):
+            with locked_open(locked_file, use_alarm=True):
+                pass
+
+        assert 0 < signal.getitimer(signal.ITIMER_REAL)[0] <= 60  # The caller's timer was not touched
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+    assert mocked_sleep.call_count == 1
+
+
+def test_locked_open_no_timeout(locked_file):
+    """It should raise a LockError immediately if the timeout is zero and the file is already locked."""
+    with pytest.raises(LockError, match='Unable to acquire exclusive lock on'):
+        with locked_open(locked_file, timeout=0):
+            assert False, 'Execution should not reach this point'
@@ -68,6 +68,12 @@ class TestLogoutd:
         self.idm.user_identifier = 'uid'
         assert self.idm.user == 'uid'
 
+    def test_logger(self):
+        """The logger should be named after the subclass and shared between its instances."""
+        # pylint: disable=protected-access
+        assert self.idm._logger.name == 'wmflib.tests.unit.test_idm.ConcreteLogoutdBase'
+        assert ConcreteLogoutdBase(['list'])._logger is self.idm._logger
+
     def test_query_user(self):
         """Test query user function."""
         assert self.idm.query_user(self.idm.user) == 'query common_name'
@@ -0,0 +1,31 @@
+"""Package initialization tests."""
+import pkgutil
+
+from types import ModuleType
+
+import pytest
+
+import wmflib
+
+
+def test_submodules():
+    """Verify that all the wmflib modules are listed in the lazily imported submodules."""
+    modules = {name for _, name, ispkg in pkgutil.iter_modules(wmflib.__path__) if not ispkg}
+    assert set(wmflib.SUBMODULES) == modules
+
+
+def test_getattr_submodule():
+    """Accessing a submodule as an attribute of the package should import and return it."""
+    assert isinstance(wmflib.actions, ModuleType)
+    assert wmflib.actions.__name__ == 'wmflib.actions'
+
+
+def test_getattr_invalid():
+    """Accessing a non-existent attribute of the package should raise AttributeError."""
+    with pytest.raises(AttributeError, match="module 'wmflib' has no attribute 'invalid'"):
+        wmflib.invalid  # pylint: disable=pointless-statement
+
+
+def test_dir():
+    """The submodules should be listed in the package attributes."""
+    assert set(wmflib.SUBMODULES).issubset(dir(wmflib))
@@ -1,5 +1,9 @@
 """Interactive module tests."""
+import io
 import logging
+import os
+import socket
+import termios
 
 from unittest import mock
 
@@ -10,6 +14,12 @@ from wmflib.exceptions import WmflibError
 from wmflib.tests import check_logs, require_caplog
 
 
+@pytest.fixture(autouse=True)
+def reset_skipped_calls():
+    """Clear the remembered skipped calls."""
+    interactive._skipped_calls.clear()  # pylint: disable=protected-access
+
+
 def example_division(positional: int, *, keyword: int = 1) -> int:
     """Example function to be used in the confirm_on_failure() tests.
 
@@ -123,6 +133,20 @@ def test_ask_input_no_tty(mocked_isatty):
         interactive.ask_input('message', ['go'])
 
 
+@mock.patch('builtins.input')
+def test_ask_input_text_only_stdout(mocked_input):
+    """It should print the messages also if stdout was replaced with a text only stream."""
+    mocked_input.side_effect = ['invalid', 'go']
+    stdout = io.StringIO()
+    stdout.isatty = lambda: True
+    with mock.patch('wmflib.interactive.sys.stdout', stdout):
+        assert interactive.ask_input('Choose', ['go']) == 'go'
+
+    assert stdout.getvalue() == (
+        '\x1b[36m==>\x1b[39m Choose\n\x1b[36m==>\x1b[39m Invalid response. Please type one of: go. '
+        'After 3 wrong answers the task will be aborted.\n')
+
+
 @pytest.mark.parametrize('choices, kwargs, message', (
     ([], {}, 'The `choices` argument is empty and no custom validator was provided'),
     ([], {'validator': None}, 'The `choices` argument is empty and no custom validator was provided'),
@@ -213,6 +237,108 @@ def test_confirm_on_failure_skip(mocked_isatty, mocked_input, capsys, caplog):
     check_logs(caplog, 'Failed to run wmflib.tests.unit.test_interactive.example_division', logging.ERROR)
 
 
+@mock.patch('builtins.input')
+def test_confirm_on_failure_system_exit(mocked_input):
+    """It should let a SystemExit exception raised in the called function pass through, without asking the user."""
+    with pytest.raises(SystemExit):
+        interactive.confirm_on_failure(mock.Mock(side_effect=SystemExit(1)))
+
+    assert not mocked_input.called
+
+
+@mock.patch('builtins.input')
+@mock.patch('wmflib.interactive.sys.stdout.isatty')
+def test_confirm_on_failure_keyboard_interrupt(mocked_isatty, mocked_input):
+    """It should ask for input if the called function is interrupted with Ctrl+c, allowing to retry it."""
+    mocked_isatty.return_value = True
+    mocked_input.return_value = 'retry'
+    func = mock.Mock(side_effect=[KeyboardInterrupt, 'done'], __qualname__='func')
+
+    assert interactive.confirm_on_failure(func) == 'done'
+    assert func.call_count == 2
+
+
+@mock.patch('builtins.input')
+@mock.patch('wmflib.interactive.sys.stdout.isatty')
+def test_confirm_on_failure_skip_remember(mocked_isatty, mocked_input):
+    """It should remember the decision to skip a call and skip it without prompting again if requested."""
+    mocked_isatty.return_value = True
+    mocked_input.return_value = 'skip'
+    func = mock.Mock(side_effect=ZeroDivisionError, __qualname__='func')
+
+    for _ in range(2):
+        assert interactive.confirm_on_failure_remember_skip(func, 1, keyword=0) is None
+
+    func.assert_called_once_with(1, keyword=0)
+    assert mocked_input.call_count == 1
+
+    assert interactive.confirm_on_failure_remember_skip(func, 2, keyword=0) is None  # Different arguments
+    assert interactive.confirm_on_failure(func, 1, keyword=0) is None  # Not remembering
+    assert mocked_input.call_count == 3
+
+
+@mock.patch('builtins.input')
+@mock.patch('wmflib.interactive.sys.stdout.isatty')
+def test_confirm_on_failure_skip_remember_unhashable(mocked_isatty, mocked_input):
+    """It should not remember the decision to skip a call with unhashable arguments."""
+    mocked_isatty.return_value = True
+    mocked_input.return_value = 'skip'
+    func = mock.Mock(side_effect=ZeroDivisionError, __qualname__='func')
+
+    for _ in range(2):
+        assert interactive.confirm_on_failure_remember_skip(func, [1]) is None
+
+    assert func.call_count == 2
+    assert mocked_input.call_count == 2
+
+
+@mock.patch('builtins.input')
+@mock.patch('wmflib.interactive.sys.stdout.isatty')
+def test_confirm_on_failure_skip_remember_instances(mocked_isatty, mocked_input):
+    """It should remember the decision to skip a bound method call only for the instance it was bound to."""
+
+    class Host:
+        """Example class with a failing method."""
+
+        def __init__(self):
+            """Initialize the instance."""
+            self.calls = 0
+
+        def restart(self, remember=False):
+            """Count the calls and fail."""
+            self.calls += 1
+            raise RuntimeError(f'Failed with remember={remember}')
+
+    mocked_isatty.return_value = True
+    mocked_input.return_value = 'skip'
+    host1 = Host()
+    host2 = Host()
+
+    assert interactive.confirm_on_failure_remember_skip(host2.restart) is None
+    assert interactive.confirm_on_failure_remember_skip(host2.restart) is None
+    assert interactive.confirm_on_failure_remember_skip(host1.restart) is None
+    assert interactive.confirm_on_failure(host1.restart, remember=True) is None  # Passed to the method
+
+    assert host2.calls == 1
+    assert host1.calls == 2
+    assert mocked_input.call_count == 3
+
+
+@mock.patch('wmflib.interactive.CONFIRM_CACHE_SIZE', 1)
+@mock.patch('builtins.input')
+@mock.patch('wmflib.interactive.sys.stdout.isatty')
+def test_confirm_on_failure_skip_remember_bounded(mocked_isatty, mocked_input):
+    """It should remember only the most recent decisions to skip a call."""
+    mocked_isatty.return_value = True
+    mocked_input.return_value = 'skip'
+    func = mock.Mock(side_effect=ZeroDivisionError, __qualname__='func')
+
+    for arg in (1, 2, 1):
+        assert interactive.confirm_on_failure_remember_skip(func, arg) is None
+
+    assert func.call_count == 3
+
+
 @require_caplog
 @mock.patch('builtins.input')
 @mock.patch('wmflib.interactive.sys.stdout.isatty')
@@ -251,9 +377,12 @@ def test_get_username_ok(monkeypatch):
 
 
 @mock.patch('wmflib.interactive.sys.stdout.isatty')
-def test_ensure_shell_is_durable_interactive(mocked_isatty):
+def test_ensure_shell_is_durable_interactive(mocked_isatty, monkeypatch):
     """Should raise WmflibError if in an interactive shell."""
     mocked_isatty.return_value = True
+    for env_name in ('STY', 'TMUX', 'TERM'):
+        monkeypatch.delenv(env_name, raising=False)
+
     with pytest.raises(WmflibError, match='Must be run in non-interactive mode or inside a screen or tmux.'):
         interactive.ensure_shell_is_durable()
 
@@ -274,6 +403,9 @@ def test_ensure_shell_is_durable_non_interactive(mocked_isatty):
     ('TMUX', '/tmux-1001/default,12345,0'),
     ('TERM', 'screen-example'),
     ('TERM', 'tmux-example'),
+    ('TERM', 'screen'),
+    ('TERM', 'screen.xterm-256color'),
+    ('TERM', 'tmux-256color'),
 ))
 def test_ensure_shell_is_durable_sty(mocked_isatty, env_name, env_value, monkeypatch):
     """Should not raise if in an interactive shell with STY set, TMUX set or a screen-line TERM."""
@@ -283,16 +415,51 @@ def test_ensure_shell_is_durable_sty(mocked_isatty, env_name, env_value, monkeyp
     assert mocked_isatty.called
 
 
+@mock.patch('wmflib.interactive.sys.stdout.isatty')
+@pytest.mark.parametrize('term', ('xterm-256color', 'vt100-screenshot', 'xtmux'))
+def test_ensure_shell_is_durable_other_term(mocked_isatty, term, monkeypatch):
+    """Should raise WmflibError if in an interactive shell with a TERM that only contains screen or tmux."""
+    mocked_isatty.return_value = True
+    for env_name in ('STY', 'TMUX'):
+        monkeypatch.delenv(env_name, raising=False)
+    monkeypatch.setenv('TERM', term)
+
+    with pytest.raises(WmflibError, match='Must be run in non-interactive mode or inside a screen or tmux.'):
+        interactive.ensure_shell_is_durable()
+
+
+@mock.patch('wmflib.interactive.sys.stdout.isatty')
+def test_tty_checks_not_cached(mocked_isatty, monkeypatch):
+    """The TTY and durable session checks should reflect any change to the stream or the environment."""
+    mocked_isatty.return_value = True
+    for env_name in ('TMUX', 'TERM'):
+        monkeypatch.delenv(env_name, raising=False)
+    monkeypatch.setenv('STY', '12345.pts-1.host')
+    interactive.ensure_shell_is_durable()
+
+    monkeypatch.delenv('STY')
+    with pytest.raises(WmflibError, match='Must be run in non-interactive mode or inside a screen or tmux.'):
+        interactive.ensure_shell_is_durable()
+
+    mocked_isatty.return_value = False
+    interactive.ensure_shell_is_durable()
+    assert mocked_isatty.call_count == 3
+
+
+@mock.patch('wmflib.interactive.sys.stdin.isatty', return_value=True)
+@mock.patch('wmflib.interactive._open_tty', return_value=None)
 @mock.patch('wmflib.interactive.getpass')
-def test_get_secret_correct_noconfirm(mocked_getpass):
+def test_get_secret_correct_noconfirm(mocked_getpass, _mocked_open_tty, _mocked_isatty):
     """Should ask for secret once and return the secret."""
     mocked_getpass.getpass.return_value = 'interactive_password'
     assert interactive.get_secret('secret') == 'interactive_password'
     mocked_getpass.getpass.assert_called_once_with(prompt='secret: ')
 
 
+@mock.patch('wmflib.interactive.sys.stdin.isatty', return_value=True)
+@mock.patch('wmflib.interactive._open_tty', return_value=None)
 @mock.patch('wmflib.interactive.getpass')
-def test_get_secret_correct(mocked_getpass):
+def test_get_secret_correct(mocked_getpass, _mocked_open_tty, _mocked_isatty):
     """Should ask for secret twice and return the secret."""
     mocked_getpass.getpass.side_effect = ['interactive_password', 'interactive_password']
     assert interactive.get_secret('secret', confirm=True) == 'interactive_password'
@@ -300,8 +467,10 @@ def test_get_secret_correct(mocked_getpass):
         [mock.call(prompt='secret: '), mock.call(prompt='Again, just to be sure: ')])
 
 
+@mock.patch('wmflib.interactive.sys.stdin.isatty', return_value=True)
+@mock.patch('wmflib.interactive._open_tty', return_value=None)
 @mock.patch('wmflib.interactive.getpass')
-def test_get_secret_bad_retry(mocked_getpass):
+def test_get_secret_bad_retry(mocked_getpass, _mocked_open_tty, _mocked_isatty):
     """Should ask for secret twice and raise WmflibError if they don't match."""
     mocked_getpass.getpass.side_effect = ['interactive_password', 'foobar']
     with pytest.raises(WmflibError, match='secret: Passwords did not match'):
@@ -310,11 +479,78 @@ def test_get_secret_bad_retry(mocked_getpass):
         [mock.call(prompt='secret: '), mock.call(prompt='Again, just to be sure: ')])
 
 
+@mock.patch('wmflib.interactive.sys.stdin.isatty', return_value=True)
+@mock.patch('wmflib.interactive._open_tty', return_value=None)
 @mock.patch('wmflib.interactive.getpass')
-def test_get_secret_too_small(mocked_getpass):
+def test_get_secret_too_small(mocked_getpass, _mocked_open_tty, _mocked_isatty):
     """Should ask for secret until the minimum length is met."""
     mocked_getpass.getpass.side_effect = ['5char', 'interactive_password']
     assert interactive.get_secret('secret') == 'interactive_password'
     mocked_getpass.getpass.assert_has_calls(
         [mock.call(prompt='secret: '),
          mock.call(prompt='Secret must be at least 6 characters. try again: ')])
+
+
+@pytest.fixture
+def mocked_tty():
+    """Mock the controlling terminal with a socket pair, yielding the other end of the pair."""
+    ours, theirs = socket.socketpair()
+    with mock.patch('wmflib.interactive._open_tty', return_value=os.dup(ours.fileno())):
+        with mock.patch('wmflib.interactive.termios') as mocked_termios:
+            mocked_termios.ECHO = termios.ECHO
+            mocked_termios.tcgetattr.return_value = [0, 0, 0, termios.ECHO | termios.ICANON, 0, 0, []]
+            yield theirs, mocked_termios
+
+    ours.close()
+    theirs.close()
+
+
+@mock.patch('wmflib.interactive.getpass')
+def test_get_secret_tty(mocked_getpass, mocked_tty):
+    """It should read all the secrets from the controlling terminal with echo disabled, restoring it at the end."""
+    tty, mocked_termios = mocked_tty
+    tty.sendall(b'5char\ninteractive_password\ninteractive_password\n')
+    assert interactive.get_secret('secret', confirm=True) == 'interactive_password'
+    assert tty.recv(1024) == (b'secret: \nSecret must be at least 6 characters. try again: \n'
+                              b'Again, just to be sure: \n')
+    assert not mocked_getpass.getpass.called
+    assert mocked_termios.tcsetattr.call_args_list[0][0][2][3] == termios.ICANON
+    assert mocked_termios.tcsetattr.call_args_list[1][0][2][3] == termios.ECHO | termios.ICANON
+
+
+def test_get_secret_tty_eof(mocked_tty):
+    """It should raise EOFError and restore the terminal if the input is closed."""
+    tty, mocked_termios = mocked_tty
+    tty.shutdown(socket.SHUT_WR)
+    with pytest.raises(EOFError):
+        interactive.get_secret('secret')
+
+    assert mocked_termios.tcsetattr.call_count == 2
+
+
+@mock.patch('wmflib.interactive.sys.stdin.isatty', return_value=True)
+@mock.patch('wmflib.interactive.getpass')
+@mock.patch('wmflib.interactive._open_tty')
+def test_get_secret_not_a_tty(mocked_open_tty, mocked_getpass, _mocked_isatty, tmp_path):
+    """It should fallback to getpass if the controlling terminal is not a terminal."""
+    mocked_open_tty.return_value = os.open(tmp_path / 'not_a_tty', os.O_RDWR | os.O_CREAT)
+    mocked_getpass.getpass.return_value = 'interactive_password'
+    assert interactive.get_secret('secret') == 'interactive_password'
+
+
+@mock.patch('wmflib.interactive.sys.stdin', new_callable=lambda: io.StringIO('short\ninteractive_password\n'))
+@mock.patch('wmflib.interactive.getpass')
+@mock.patch('wmflib.interactive._open_tty', return_value=None)
+def test_get_secret_stdin(_mocked_open_tty, mocked_getpass, _mocked_stdin, capsys):
+    """It should read from stdin without using getpass if there is no terminal and stdin is not interactive."""
+    assert interactive.get_secret('secret') == 'interactive_password'
+    assert capsys.readouterr().err == 'secret: Secret must be at least 6 characters. try again: '
+    assert not mocked_getpass.getpass.called
+
+
+@mock.patch('wmflib.interactive.sys.stdin', new_callable=io.StringIO)
+@mock.patch('wmflib.interactive._open_tty', return_value=None)
+def test_get_secret_stdin_eof(_mocked_open_tty, _mocked_stdin):
+    """It should raise EOFError if there is no terminal and stdin has no more data."""
+    with pytest.raises(EOFError):
+        interactive.get_secret('secret')
@@ -4,6 +4,8 @@ import socket
 
 from unittest import mock
 
+import pytest
+
 from wmflib.irc import SALSocketHandler, SocketHandler
 
 
@@ -57,6 +59,21 @@ class TestIrc:
         assert mock.call().connect(('host', 123)) in mocked_socket.mock_calls
         assert mock.call().sendall(b'!log user@current-hostname Prefix - message') in mocked_socket.mock_calls
 
+    @pytest.mark.parametrize('message', ('', '  '))
+    @mock.patch('wmflib.irc.socket.socket')
+    def test_socket_handler_emit_empty(self, mocked_socket, message):
+        """Calling emit() with an empty message should send only the prefix, without trailing spaces."""
+        record = logging.LogRecord('module', logging.DEBUG, '/source/file.py', 1, message, [], None)
+        self.handler.emit(record)
+        assert mock.call().sendall(b'user@current-hostname') in mocked_socket.mock_calls
+
+    @mock.patch('wmflib.irc.socket.gethostname', return_value='current-hostname')
+    @mock.patch('wmflib.irc.socket.socket')
+    def test_socket_handler_emit_empty_username(self, mocked_socket, _mocked_hostname):
+        """Calling emit() on a SocketHandler instance with an empty username should strip the leading space."""
+        SocketHandler('host', 123, '').emit(GENERIC_LOG_RECORD)
+        assert mock.call().sendall(b'@current-hostname message') in mocked_socket.mock_calls
+
     @mock.patch('wmflib.irc.socket.socket')
     def test_irc_socket_handler_emit_ko(self, mocked_socket):
         """If an error occur while calling emit() on an SALSocketHandler instance, it should call handleError."""
@@ -67,3 +84,12 @@ class TestIrc:
 
         mocked_socket.assert_called_once_with(socket.AF_INET, socket.SOCK_STREAM)
         self.sal_handler.handleError.assert_called_once_with(GENERIC_LOG_RECORD)
+
+    @mock.patch('wmflib.irc.socket.socket')
+    def test_socket_handler_emit_connection_per_message(self, mocked_socket):
+        """Calling emit() multiple times should send each message on its own connection, closing it afterwards."""
+        self.handler.emit(GENERIC_LOG_RECORD)
+        self.handler.emit(GENERIC_LOG_RECORD)
+        assert mocked_socket.call_count == 2
+        assert mocked_socket.return_value.sendall.call_count == 2
+        assert mocked_socket.return_value.close.call_count == 2
@@ -1,4 +1,6 @@
 """Phabricator module tests."""
+import os
+
 from unittest import mock
 
 import pytest
@@ -7,18 +9,63 @@ from wmflib import phabricator
 from wmflib.tests import get_fixture_path
 
 
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    """Clear the cached bot configs, as some tests modify the config files."""
+    phabricator._CONFIG_CACHE.clear()  # pylint: disable=protected-access
+
+
 def test_create_phabricator_ok():
     """It should initialize the instance."""
     phab = phabricator.create_phabricator(get_fixture_path('phabricator', 'valid.conf'))
     assert isinstance(phab, phabricator.Phabricator)
 
 
+@mock.patch('wmflib.phabricator.phabricator.Phabricator')
+def test_create_phabricator_client_not_shared(mocked_phabricator):
+    """It should create a new Phabricator client at each call, without sharing it between callers."""
+    phabricator.create_phabricator(get_fixture_path('phabricator', 'valid.conf'))
+    phabricator.create_phabricator(get_fixture_path('phabricator', 'valid.conf'), dry_run=False)
+    mocked_phabricator.assert_has_calls([  # nosec
+        mock.call(host='https://phabricator.example.com/api/', username='phab-bot', token='api-12345')] * 2)
+
+
 def test_create_phabricator_missing_section():
     """It should raise PhabricatorError if the specified section is missing in the bot config file."""
     with pytest.raises(phabricator.PhabricatorError, match='Unable to find section'):
         phabricator.create_phabricator(get_fixture_path('phabricator', 'valid.conf'), section='nonexistent')
 
 
+def test_create_phabricator_missing_file(tmp_path):
+    """It should raise PhabricatorError if the bot config file does not exists."""
+    with pytest.raises(phabricator.PhabricatorError, match='Unable to load config file .*No such file or directory'):
+        phabricator.create_phabricator(str(tmp_path / 'nonexistent.conf'))
+
+
+def test_create_phabricator_invalid_file(tmp_path):
+    """It should raise PhabricatorError with the parsing error if the bot config file is not valid."""
+    config_file = tmp_path / 'invalid.conf'
+    config_file.write_text('host = https://phabricator.example.com/api/\n')
+    with pytest.raises(phabricator.PhabricatorError, match='Unable to load config file .*no section headers'):
+        phabricator.create_phabricator(str(config_file))
+
+
+@mock.patch('wmflib.phabricator.phabricator.Phabricator')
+def test_create_phabricator_config_cached(mocked_phabricator, tmp_path):
+    """It should parse the bot config file again only if modified."""
+    config_file = tmp_path / 'bot.conf'
+    config_file.write_text('[phabricator_bot]\nhost = https://phab.example.com/api/\nusername = bot\ntoken = api-1\n')
+    phabricator.create_phabricator(str(config_file))
+    with mock.patch('wmflib.phabricator.load_ini_config') as mocked_load:
+        phabricator.create_phabricator(str(config_file))
+        assert not mocked_load.called
+
+    config_file.write_text('[phabricator_bot]\nhost = https://phab.example.com/api/\nusername = bot\ntoken = api-2\n')
+    os.utime(config_file, ns=(0, 0))  # Ensure a different mtime even on filesystems with coarse timestamps
+    phabricator.create_phabricator(str(config_file))
+    mocked_phabricator.assert_called_with(host='https://phab.example.com/api/', username='bot', token='api-2')
+
+
 def test_create_phabricator_missing_option():
     """It should raise PhabricatorError if any of the mandatory option is missing in the bot config file."""
     with pytest.raises(phabricator.PhabricatorError, match='Unable to find all required options'):
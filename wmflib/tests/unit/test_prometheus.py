@@ -18,6 +18,8 @@ def get_response_data(check='ok'):
     }
     if check == 'empty_result':
         json_data['data']['result'] = []
+    elif check == 'missing_result':
+        del json_data['data']['result']
     elif check == 'error':
         del json_data['data']
         json_data['status'] = 'error'
@@ -40,6 +42,11 @@ class TestPrometheus:
         """It should initialise the instance."""
         assert isinstance(self.prometheus, Prometheus)
 
+    def test_init_shared_session(self):
+        """All the instances of the same class should share the same HTTP session."""
+        assert Prometheus()._http_session is self.prometheus._http_session  # pylint: disable=protected-access
+        assert Thanos()._http_session is not self.prometheus._http_session  # pylint: disable=protected-access
+
     def test_bad_site(self):
         """Test with a bad site parameter."""
         with pytest.raises(
@@ -68,6 +75,35 @@ class TestPrometheus:
         requests_mock.get(self.ops_uri, json=get_response_data('empty_result'), status_code=200)
         assert not self.prometheus.query('query_string', 'eqiad')
 
+    def test_query_missing_result(self, requests_mock):
+        """It should return an empty result if the response has no result."""
+        requests_mock.get(self.ops_uri, json=get_response_data('missing_result'), status_code=200)
+        assert self.prometheus.query('query_string', 'eqiad') == []
+
+    def test_query_many_ok(self, requests_mock):
+        """It should perform all the queries and return the results in the same order."""
+        requests_mock.get(f'{self.ops_uri}?query=query_ok', json=get_response_data('ok'), status_code=200)
+        requests_mock.get(f'{self.ops_uri}?query=query_empty', json=get_response_data('empty_result'), status_code=200)
+        results = self.prometheus.query_many(['query_ok', 'query_empty', 'query_ok'], 'eqiad')
+        assert [len(result) for result in results] == [1, 0, 1]
+
+    def test_query_many_empty(self):
+        """It should return an empty list without performing any query if no queries are passed."""
+        assert self.prometheus.query_many([], 'eqiad') == []
+
+    def test_query_many_error(self, requests_mock):
+        """It should raise PrometheusError if any of the queries fails."""
+        requests_mock.get(f'{self.ops_uri}?query=query_ok', json=get_response_data('ok'), status_code=200)
+        requests_mock.get(f'{self.ops_uri}?query=query_error', json=get_response_data('error'), status_code=200)
+        with pytest.raises(PrometheusError, match='Unable to get metric: Foobar error'):
+            self.prometheus.query_many(['query_ok', 'query_error'], 'eqiad')
+
+    def test_query_many_bad_site(self):
+        """It should raise PrometheusError if the site is not valid."""
+        with pytest.raises(
+                PrometheusError, match=r'site \(bad_site\) must be one of wmflib.constants.ALL_DATACENTERS'):
+            self.prometheus.query_many(['query_string'], 'bad_site')
+
 
 class TestThanos:
     """Test class for the Prometheus class."""
@@ -87,3 +123,12 @@ class TestThanos:
         requests_mock.get(f'{self.uri}?dedup=true&partial_response=false&query=query_string',
                           json=get_response_data('ok'), status_code=200)
         assert 'value' in self.thanos.query('query_string')[0]
+
+    def test_query_many_ok(self, requests_mock):
+        """It should perform all the queries and return the results in the same order."""
+        requests_mock.get(f'{self.uri}?dedup=true&partial_response=false&query=query_ok',
+                          json=get_response_data('ok'), status_code=200)
+        requests_mock.get(f'{self.uri}?dedup=true&partial_response=false&query=query_empty',
+                          json=get_response_data('empty_result'), status_code=200)
+        results = self.thanos.query_many(['query_empty', 'query_ok'])
+        assert [len(result) for result in results] == [0, 1]
@@ -5,7 +5,7 @@ import pytest
 
 from requests import Request, Session
 
-from wmflib import requests
+from wmflib import __version__, requests
 
 
 def test_timeout_http_adapter_init_default():
@@ -83,14 +83,33 @@ def test_session_custom_codes_methods():
     assert getattr(session.adapters['https://'].max_retries, param_name) == ('GET',)
 
 
+@pytest.mark.skipif(not hasattr(requests.Retry.DEFAULT, 'backoff_jitter'), reason='Requires urllib3 >= 2.0.0')
+def test_session_backoff_jitter():
+    """Calling session with a backoff jitter should return a Requests's session with that value."""
+    assert requests.http_session('UA-name').adapters['https://'].max_retries.backoff_jitter == 0.0
+    session = requests.http_session('UA-name', backoff_jitter=0.5)
+    assert session.adapters['https://'].max_retries.backoff_jitter == 0.5
+
+
 def test_session():
     """Calling session should return a Requests's session pre-configured."""
     session = requests.http_session('UA-name')
     assert isinstance(session, Session)
-    assert 'UA-name' in session.headers['User-Agent']
+    assert session.headers['User-Agent'] == (
+        f'pywmflib/{__version__} UA-name +https://wikitech.wikimedia.org/wiki/Python/Wmflib')
 
 
 def test_session_no_retry():
     """It should not add the retry logic to the session."""
     session = requests.http_session('UA-name', tries=0)
     assert session.adapters['https://'].max_retries.total == 0
+
+
+@pytest.mark.parametrize('tries', (0, 3))
+def test_session_pool(tries):
+    """It should configure the connection pools of the adapters with the given parameters."""
+    session = requests.http_session('UA-name', tries=tries, pool_connections=5, pool_maxsize=20, pool_block=True)
+    for adapter in (session.adapters['http://'], session.adapters['https://']):
+        assert adapter.poolmanager.connection_pool_kw['maxsize'] == 20
+        assert adapter.poolmanager.connection_pool_kw['block'] is True
+        assert adapter.poolmanager.pools._maxsize == 5  # pylint: disable=protected-access